@@ -110,7 +110,7 @@ def run_distributions(
             norm_table.add_column("P-Value", justify="right")
             norm_table.add_column("Normal?", justify="center")
 
-            for test_name in ("shapiro_wilk", "anderson_darling", "dagostino_pearson", "kolmogorov_smirnov"):
+            for test_name in ("shapiro_wilk", "anderson_darling", "dagostino_pearson"):
                 test_data = normality.get(test_name)
                 if test_data and isinstance(test_data, dict):
                     stat = test_data.get("statistic", 0)
@@ -2,9 +2,12 @@ import typer
 import polars as pl
 from pathlib import Path
 from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+import io
 import os
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+from datatui.core.correlations import pairwise_pearson_matrix
 from datatui.visualizers import (
     generate_histogram, generate_box_plot, generate_correlation_heatmap,
     generate_scatter_plot, generate_pair_plot, generate_violin_plot,
@@ -59,7 +62,7 @@ def run_visualize(
         elif type == "heatmap":
             numeric_df = df.select(pl.col(pl.NUMERIC_DTYPES))
             if numeric_df.width < 2: raise ValueError("Heatmap requires at least 2 numeric columns")
-            corr_matrix = numeric_df.to_pandas().corr().values.tolist()
+            corr_matrix = pairwise_pearson_matrix(numeric_df)
             labels = numeric_df.columns
             generate_correlation_heatmap(corr_matrix, labels, output, format, dpi)
         elif type == "scatter":
@@ -114,7 +117,7 @@ def run_visualize(
             # Compute correlation matrix first
             numeric_df = df.select(pl.col(pl.NUMERIC_DTYPES))
             if numeric_df.width < 2: raise ValueError("Heatmap requires at least 2 numeric columns")
-            corr_matrix = numeric_df.to_pandas().corr().values.tolist()
+            corr_matrix = pairwise_pearson_matrix(numeric_df)
             labels = numeric_df.columns
             generate_correlation_heatmap(corr_matrix, labels, output, format, dpi)
         elif type == "scatter":
@@ -148,11 +151,15 @@ def run_visualize(
         console.print(f"[red]Error generating plot: {e}[/]")
         raise typer.Exit(1)
 
-def run_batch_mode(df: pl.DataFrame, output_dir: Path, format: str, dpi: int):
+def run_batch_mode(df: pl.DataFrame, output_dir: Path, format: str, dpi: int,
+                   numeric_df: Optional[pl.DataFrame] = None,
+                   corr_matrix: Optional[List[List[float]]] = None):
     """Generate a batch of recommended plots."""
     os.makedirs(output_dir, exist_ok=True)
     
-    numeric_cols = [c for c, t in zip(df.columns, df.dtypes) if t in pl.NUMERIC_DTYPES]
+    if numeric_df is None:
+        numeric_df = df.select(pl.col(pl.NUMERIC_DTYPES))
+    numeric_cols = numeric_df.columns
     cat_cols = [c for c, t in zip(df.columns, df.dtypes) if t in [pl.String, pl.Categorical]]
     
     plots_to_generate = []
@@ -182,32 +189,43 @@ def run_batch_mode(df: pl.DataFrame, output_dir: Path, format: str, dpi: int):
         BarColumn(),
         TaskProgressColumn(),
         console=console
-    ) as progress:
+    ) as progress, ThreadPoolExecutor(max_workers=4) as writer:
         task = progress.add_task("[cyan]Generating batch plots...", total=len(plots_to_generate))
         
-        generated_files = []
+        # Figures are rendered serially (matplotlib is not thread-safe) into
+        # memory; only the file writes are handed to the pool so they overlap.
+        pending = []
         for ptype, pinfo, ppath in plots_to_generate:
             progress.update(task, description=f"Generating {ptype} for {pinfo if pinfo else 'dataset'}...")
+            buf = io.BytesIO()
             try:
                 if ptype == "histogram":
-                    generate_histogram(df, pinfo, ppath, format, dpi)
+                    generate_histogram(df, pinfo, buf, format, dpi)
                 elif ptype == "box":
-                    generate_box_plot(df, pinfo, ppath, format, dpi)
+                    generate_box_plot(df, pinfo, buf, format, dpi)
                 elif ptype == "heatmap":
-                    numeric_df = df.select(pl.col(pl.NUMERIC_DTYPES))
-                    corr_matrix = numeric_df.to_pandas().corr().values.tolist()
-                    generate_correlation_heatmap(corr_matrix, numeric_df.columns, ppath, format, dpi)
+                    if corr_matrix is None:
+                        corr_matrix = pairwise_pearson_matrix(numeric_df)
+                    generate_correlation_heatmap(corr_matrix, numeric_df.columns, buf, format, dpi)
                 elif ptype == "categorical":
-                    generate_categorical_bar(df, pinfo, ppath, 20, format, dpi)
+                    generate_categorical_bar(df, pinfo, buf, 20, format, dpi)
                 elif ptype == "missing":
-                    generate_missing_pattern(df, ppath, format, dpi)
+                    generate_missing_pattern(df, buf, format, dpi)
                 
-                generated_files.append({"type": ptype, "info": str(pinfo), "path": ppath.name})
+                pending.append((writer.submit(ppath.write_bytes, buf.getvalue()), ptype, pinfo, ppath))
             except Exception as e:
                 console.print(f"[yellow]Skipped {ptype}: {e}[/]")
             
             progress.advance(task)
 
+        generated_files = []
+        for future, ptype, pinfo, ppath in pending:
+            try:
+                future.result()
+                generated_files.append({"type": ptype, "info": str(pinfo), "path": ppath.name})
+            except Exception as e:
+                console.print(f"[yellow]Skipped {ptype}: {e}[/]")
+
     # Create index.html
     create_batch_index(output_dir, generated_files)
     console.print(f"[bold green]Batch generation complete![/] View results in [blue]{output_dir}/index.html[/]")
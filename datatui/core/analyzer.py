@@ -1,6 +1,8 @@
 import polars as pl
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, asdict, fields
 import time
 
 from .schema import SchemaDetector
@@ -8,7 +10,23 @@ from .statistics import StatisticsAnalyzer
 from .missing import MissingAnalyzer
 from .outliers import OutlierDetector
 from .correlations import CorrelationAnalyzer
-from .distributions import DistributionAnalyzer
+from .distributions import DistributionAnalyzer, histogram_to_lists
+
+_CATEGORICAL_DTYPES = frozenset({pl.String, pl.Categorical, pl.Boolean})
+
+# IsolationForest fit (contamination offset) and predict both score every row
+MULTIVARIATE_OUTLIER_MAX_ROWS = 100_000
+
+
+def _shallow_asdict(obj) -> Dict[str, Any]:
+    """Field dict of a flat dataclass without asdict's recursive deep copy."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def _distribution_asdict(info) -> Dict[str, Any]:
+    result = _shallow_asdict(info)
+    result['histogram'] = histogram_to_lists(info.histogram)
+    return result
 
 
 @dataclass
@@ -38,14 +56,21 @@ class DataAnalyzer:
     def analyze_all(self, skip_multivariate_outliers: bool = False) -> AnalysisResult:
         start_time = time.time()
         
-        schema_results = self.analyze_schema()
-        statistics_results = self.analyze_statistics()
-        missing_results = self.analyze_missing()
-        outliers_results = self.analyze_outliers(skip_multivariate=skip_multivariate_outliers)
-        correlations_results = self.analyze_correlations()
-        distributions_results = self.analyze_distributions()
+        # The analyses are independent and spend most of their time in
+        # Polars/NumPy/SciPy, which release the GIL. The public methods are
+        # submitted so each result still lands in self._cache.
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = {
+                'schema': executor.submit(self.analyze_schema),
+                'statistics': executor.submit(self.analyze_statistics),
+                'missing': executor.submit(self.analyze_missing),
+                'outliers': executor.submit(self.analyze_outliers, skip_multivariate=skip_multivariate_outliers),
+                'correlations': executor.submit(self.analyze_correlations),
+                'distributions': executor.submit(self.analyze_distributions),
+            }
+            memory_mb = self._estimate_memory()
         
-        memory_mb = self._estimate_memory()
+        results = {name: future.result() for name, future in futures.items()}
         
         analysis_time = time.time() - start_time
         
@@ -55,12 +80,7 @@ class DataAnalyzer:
             total_columns=self.total_columns,
             memory_mb=memory_mb,
             analysis_time_seconds=analysis_time,
-            schema=schema_results,
-            statistics=statistics_results,
-            missing=missing_results,
-            outliers=outliers_results,
-            correlations=correlations_results,
-            distributions=distributions_results
+            **results
         )
     
     def analyze_schema(self) -> Dict[str, Any]:
@@ -104,7 +124,7 @@ class DataAnalyzer:
         multivariate_outliers = None
         if not skip_multivariate:
             numeric_cols = detector._get_numeric_columns()
-            if len(numeric_cols) > 1 and self.total_rows < 100000:
+            if len(numeric_cols) > 1 and self.total_rows < MULTIVARIATE_OUTLIER_MAX_ROWS:
                 try:
                     multivariate_outliers = detector.detect_multivariate_outliers(
                         columns=numeric_cols,
@@ -114,8 +134,8 @@ class DataAnalyzer:
                     multivariate_outliers = None
         
         result = {
-            'univariate': {col: asdict(info) for col, info in univariate_outliers.items()},
-            'multivariate': asdict(multivariate_outliers) if multivariate_outliers else None,
+            'univariate': {col: _shallow_asdict(info) for col, info in univariate_outliers.items()},
+            'multivariate': _shallow_asdict(multivariate_outliers) if multivariate_outliers else None,
             'summary': detector.get_outlier_summary()
         }
         
@@ -131,20 +151,20 @@ class DataAnalyzer:
         all_correlations = analyzer.analyze_all()
         
         pearson_pairs = [
-            asdict(pair) for pair in all_correlations['pearson'].values()
+            _shallow_asdict(pair) for pair in all_correlations['pearson'].values()
         ]
         spearman_pairs = [
-            asdict(pair) for pair in all_correlations['spearman'].values()
+            _shallow_asdict(pair) for pair in all_correlations['spearman'].values()
         ]
         cramers_pairs = [
-            asdict(pair) for pair in all_correlations['cramers_v'].values()
+            _shallow_asdict(pair) for pair in all_correlations['cramers_v'].values()
         ]
         mixed_pairs = [
-            asdict(pair) for pair in all_correlations['mixed'].values()
+            _shallow_asdict(pair) for pair in all_correlations['mixed'].values()
         ]
         
         top_correlations = [
-            asdict(pair) for pair in analyzer.get_top_correlations(n=20, min_correlation=0.3)
+            _shallow_asdict(pair) for pair in analyzer.get_top_correlations(n=20, min_correlation=0.3)
         ]
         
         correlation_matrix = analyzer.get_correlation_matrix(method='pearson')
@@ -172,10 +192,10 @@ class DataAnalyzer:
         all_distributions = analyzer.analyze_all(bins=bins)
         
         distributions_dict = {
-            col: asdict(info) for col, info in all_distributions.items()
+            col: _distribution_asdict(info) for col, info in all_distributions.items()
         }
         
-        summary = analyzer.get_distribution_summary()
+        summary = analyzer.get_distribution_summary(bins=bins)
         
         result = {
             'distributions': distributions_dict,
@@ -192,14 +212,16 @@ class DataAnalyzer:
         return result
     
     def _estimate_memory(self) -> float:
+        if 'memory_mb' in self._cache:
+            return self._cache['memory_mb']
+        
         try:
-            total_bytes = sum(
-                self.df[col].estimated_size() 
-                for col in self.df.columns
-            )
-            return total_bytes / (1024 * 1024)
+            result = self.df.estimated_size("mb")
         except Exception:
             return 0.0
+        
+        self._cache['memory_mb'] = result
+        return result
     
     def get_quick_summary(self) -> Dict[str, Any]:
         schema = self.analyze_schema()
@@ -215,6 +237,23 @@ class DataAnalyzer:
             'complete_rows_percentage': missing.get('complete_rows_percentage', 100.0)
         }
     
+    @cached_property
+    def _dtypes(self) -> Dict[str, pl.DataType]:
+        return dict(self.df.schema)
+    
+    def get_column_groups(self) -> Tuple[List[str], List[str], List[str]]:
+        """Numeric, categorical and all column names, read from the schema once."""
+        if 'column_groups' not in self._cache:
+            numeric_cols = []
+            cat_cols = []
+            for name, dtype in self._dtypes.items():
+                if dtype.is_numeric():
+                    numeric_cols.append(name)
+                elif dtype.base_type() in _CATEGORICAL_DTYPES:
+                    cat_cols.append(name)
+            self._cache['column_groups'] = (numeric_cols, cat_cols, list(self.df.columns))
+        return self._cache['column_groups']
+    
     def clear_cache(self):
         self._cache = {}
     
@@ -222,39 +261,56 @@ class DataAnalyzer:
         if column not in self.df.columns:
             return {'error': f'Column {column} not found'}
         
-        schema = self.analyze_schema()
-        statistics = self.analyze_statistics()
-        missing = self.analyze_missing()
-        outliers = self.analyze_outliers()
-        distributions = self.analyze_distributions()
-        
         result = {
             'column_name': column,
             'exists': True
         }
         
-        if column in schema.get('columns', {}):
-            col_schema = schema['columns'][column]
+        is_numeric = self._dtypes[column].is_numeric()
+        
+        col_schema = self._column_section(
+            'schema', lambda r: r.get('columns', {}).get(column),
+            lambda: SchemaDetector(self.df)._analyze_column(column)
+        )
+        if col_schema is not None:
             result['schema'] = asdict(col_schema)
         
-        if column in statistics.get('statistics', {}):
-            col_stats = statistics['statistics'][column]
+        col_stats = self._column_section(
+            'statistics', lambda r: r.get('statistics', {}).get(column),
+            lambda: StatisticsAnalyzer(self.df).analyze_column(column)
+        )
+        if col_stats is not None:
             result['statistics'] = asdict(col_stats)
         
-        if column in missing.get('columns', {}):
-            col_missing = missing['columns'][column]
+        col_missing = self._column_section(
+            'missing', lambda r: r.get('columns', {}).get(column),
+            lambda: MissingAnalyzer(self.df.select(column))._analyze_columns()[column]
+        )
+        if col_missing is not None:
             result['missing'] = asdict(col_missing)
         
-        if column in outliers.get('univariate', {}):
-            col_outliers = outliers['univariate'][column]
+        col_outliers = self._column_section(
+            'outliers', lambda r: r.get('univariate', {}).get(column),
+            lambda: _shallow_asdict(OutlierDetector(self.df)._detect_column_outliers(column)) if is_numeric else None
+        )
+        if col_outliers is not None:
             result['outliers'] = col_outliers
         
-        if column in distributions.get('distributions', {}):
-            col_dist = distributions['distributions'][column]
+        col_dist = self._column_section(
+            'distributions', lambda r: r.get('distributions', {}).get(column),
+            lambda: _distribution_asdict(DistributionAnalyzer(self.df)._analyze_column(column)) if is_numeric else None
+        )
+        if col_dist is not None:
             result['distribution'] = col_dist
         
         return result
     
+    def _column_section(self, key: str, lookup, compute):
+        """Column entry from a cached whole-frame analysis, else computed for that column alone."""
+        if key in self._cache:
+            return lookup(self._cache[key])
+        return compute()
+    
     def get_data_quality_score(self) -> Dict[str, Any]:
         missing = self.analyze_missing()
         outliers = self.analyze_outliers(skip_multivariate=True)
@@ -6,7 +6,7 @@ from scipy.stats import pearsonr, spearmanr, pointbiserialr
 import math
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrelationPair:
     column1: str
     column2: str
@@ -41,12 +41,7 @@ class CorrelationAnalyzer:
         }
     
     def _get_numeric_columns(self) -> List[str]:
-        numeric_cols = []
-        for col in self.df.columns:
-            dtype = str(self.df[col].dtype)
-            if any(t in dtype for t in ['Int', 'UInt', 'Float']):
-                numeric_cols.append(col)
-        return numeric_cols
+        return [col for col, dtype in self.df.schema.items() if dtype.is_numeric()]
     
     def _get_categorical_columns(self) -> List[str]:
         categorical_cols = []
@@ -317,6 +312,38 @@ def get_correlation_matrix(df: pl.DataFrame, method: str = 'pearson') -> Dict[st
     return analyzer.get_correlation_matrix(method=method)
 
 
+def pairwise_pearson_matrix(numeric_df: pl.DataFrame) -> List[List[float]]:
+    """Pearson matrix over pairwise-complete rows, as pandas' DataFrame.corr computes it."""
+    # The 2-D export is the one copy; everything below works on it in place
+    arr = numeric_df.cast(pl.Float64).to_numpy()
+    invalid = np.isnan(arr)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if not invalid.any():
+            return np.atleast_2d(np.corrcoef(arr, rowvar=False)).tolist()
+        
+        # Centre on each column's mean to keep the sums well conditioned, then zero
+        # the gaps so every pairwise sum below only sees rows where both are present
+        arr[invalid] = 0.0
+        valid = (~invalid).astype(np.float64)
+        arr -= arr.sum(axis=0) / valid.sum(axis=0)
+        arr[invalid] = 0.0
+        del invalid
+        
+        n = valid.T @ valid
+        sx = arr.T @ valid
+        sxx = (arr * arr).T @ valid
+        sxy = arr.T @ arr
+        
+        cov = sxy - sx * sx.T / n
+        var_x = sxx - sx * sx / n
+        var_y = var_x.T
+        matrix = np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+        matrix[n < 2] = np.nan
+    
+    return matrix.tolist()
+
+
 def get_top_correlations(df: pl.DataFrame, n: int = 10, min_correlation: float = 0.5) -> List[CorrelationPair]:
     analyzer = CorrelationAnalyzer(df)
     return analyzer.get_top_correlations(n=n, min_correlation=min_correlation)
@@ -328,11 +355,8 @@ def get_correlation_for_columns(df: pl.DataFrame, col1: str, col2: str) -> Dict[
     if col1 not in df.columns or col2 not in df.columns:
         return {'error': 'One or both columns not found'}
     
-    dtype1 = str(df[col1].dtype)
-    dtype2 = str(df[col2].dtype)
-    
-    is_numeric1 = any(t in dtype1 for t in ['Int', 'UInt', 'Float'])
-    is_numeric2 = any(t in dtype2 for t in ['Int', 'UInt', 'Float'])
+    is_numeric1 = df.schema[col1].is_numeric()
+    is_numeric2 = df.schema[col2].is_numeric()
     
     result = {}
     
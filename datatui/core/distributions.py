@@ -1,12 +1,25 @@
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+
 import polars as pl
 import numpy as np
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from scipy import stats
-from scipy.stats import shapiro, anderson, kstest, normaltest
+from scipy.stats import shapiro, anderson, normaltest
+
+QUANTILES = (0.0, 0.25, 0.5, 0.75, 1.0)
+NORMALITY_SAMPLE_ROWS = 10_000
+# scipy's Shapiro-Wilk p-value is only reliable up to 5000 observations
+SHAPIRO_MAX_ROWS = 5_000
+KDE_FFT_MIN_ROWS = 10_000
+KDE_FFT_GRID = 2048
+_MOMENT_KEYS = ('mean', 'std', 'skewness', 'kurtosis')
 
 
-@dataclass
+@dataclass(slots=True)
 class DistributionInfo:
     column_name: str
     histogram: Dict[str, Any]
@@ -24,43 +37,116 @@ class DistributionAnalyzer:
     def __init__(self, df: pl.DataFrame):
         self.df = df
         self.total_rows = len(df)
+        self._cache = {}
     
     def analyze_all(self, bins: int = 30) -> Dict[str, DistributionInfo]:
-        distributions = {}
+        cache_key = f'analyze_all_{bins}'
+        if cache_key in self._cache:
+            return self._cache[cache_key]
         
-        numeric_cols = self._get_numeric_columns()
+        numeric_cols = self.numeric_cols
+        moments = self._batch_moments(numeric_cols)
         
-        for col in numeric_cols:
-            distributions[col] = self._analyze_column(col, bins=bins)
+        # The SciPy tests run in compiled code, so columns overlap well across threads
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(
+                lambda col: self._analyze_column(col, bins=bins, moments=moments.get(col)), numeric_cols
+            )
+            distributions = dict(zip(numeric_cols, results))
         
+        self._cache[cache_key] = distributions
         return distributions
     
-    def _get_numeric_columns(self) -> List[str]:
-        numeric_cols = []
-        for col in self.df.columns:
-            dtype = str(self.df[col].dtype)
-            if any(t in dtype for t in ['Int', 'UInt', 'Float']):
-                numeric_cols.append(col)
-        return numeric_cols
+    @cached_property
+    def numeric_cols(self) -> List[str]:
+        return [col for col, dtype in self.df.schema.items() if dtype.is_numeric()]
+    
+    @cached_property
+    def _numeric_col_set(self) -> frozenset:
+        return frozenset(self.numeric_cols)
     
-    def _analyze_column(self, column: str, bins: int = 30) -> DistributionInfo:
-        series = self.df[column].drop_nulls()
+    def _batch_moments(self, columns: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Moments and quartiles of every column from one Polars query."""
+        if not columns:
+            return {}
         
-        if len(series) == 0:
-            return self._empty_distribution(column)
+        exprs = []
+        for i, col in enumerate(columns):
+            c = pl.col(col).cast(pl.Float64)
+            exprs.extend([
+                c.mean().alias(f"{i}_mean"),
+                c.std(ddof=0).alias(f"{i}_std"),
+                c.skew().alias(f"{i}_skewness"),
+                c.kurtosis().alias(f"{i}_kurtosis"),
+                c.drop_nulls().n_unique().alias(f"{i}_n_unique"),
+            ])
+            exprs.extend(
+                c.quantile(q, interpolation='linear').alias(f"{i}_q{j}") for j, q in enumerate(QUANTILES)
+            )
+        row = self.df.lazy().select(exprs).collect().row(0, named=True)
+        
+        as_float = lambda v: float('nan') if v is None else float(v)
+        return {
+            col: {
+                **{key: as_float(row[f"{i}_{key}"]) for key in _MOMENT_KEYS},
+                'quantiles': [as_float(row[f"{i}_q{j}"]) for j in range(len(QUANTILES))],
+                'n_unique': row[f"{i}_n_unique"],
+            }
+            for i, col in enumerate(columns)
+        }
+    
+    @staticmethod
+    def _column_moments(data: np.ndarray) -> Dict[str, Any]:
+        # All moments in a single pass, plus one partition-based selection for the quartiles
+        desc = stats.describe(data)
+        n = desc.nobs
+        return {
+            'mean': float(desc.mean),
+            'std': math.sqrt(desc.variance * (n - 1) / n) if n > 1 else 0.0,
+            'skewness': float(desc.skewness),
+            'kurtosis': float(desc.kurtosis),
+            'quantiles': np.quantile(data, QUANTILES).tolist(),
+            'n_unique': None,
+        }
+    
+    def _analyze_column(self, column: str, bins: int = 30,
+                        moments: Optional[Dict[str, Any]] = None) -> DistributionInfo:
+        # Converted once and shared by every helper below
+        data = self._get_column_float_array(column)
         
-        histogram = self._calculate_histogram(series, bins=bins)
-        normality_tests = self._test_normality(series)
-        distribution_type = self._detect_distribution_type(series, normality_tests)
+        if len(data) == 0:
+            return self._empty_distribution(column)
         
-        skewness = self._calculate_skewness(series)
-        kurtosis = self._calculate_kurtosis(series)
+        # analyze_all batches these across columns; single-column callers compute them here
+        if moments is None:
+            moments = self._column_moments(data)
+        n = len(data)
+        mean = moments['mean']
+        std = moments['std']
+        skewness = moments['skewness'] if n >= 3 else 0.0
+        kurtosis = moments['kurtosis'] if n >= 4 else 0.0
+        q0, q25, q50, q75, q100 = moments['quantiles']
+        data_min, data_max = q0, q100
+        
+        histogram = self._calculate_histogram(data, bins=bins, data_range=(data_min, data_max))
+        normality_tests = self._test_normality(data)
+        distribution_type = self._detect_distribution_type(
+            data, normality_tests, mean, std, skewness, kurtosis, data_min,
+            unique_count=moments['n_unique']
+        )
         
         is_normal = normality_tests.get('is_normal', False)
         
-        quartiles = self._calculate_quartiles(series)
+        quartiles = {
+            'min': q0,
+            'q25': q25,
+            'median': q50,
+            'q75': q75,
+            'max': q100,
+            'iqr': q75 - q25
+        }
         
-        kde_available = len(series) > 10
+        kde_available = len(data) > 10
         
         return DistributionInfo(
             column_name=column,
@@ -87,71 +173,81 @@ class DistributionAnalyzer:
             quartiles={}
         )
     
-    def _calculate_histogram(self, series: pl.Series, bins: int = 30) -> Dict[str, Any]:
-        data = series.to_numpy().astype(float)
-        
-        counts, edges = np.histogram(data, bins=bins)
-        
-        bin_centers = (edges[:-1] + edges[1:]) / 2
+    def _get_column_float_array(self, column: str) -> np.ndarray:
+        """Non-null values of ``column`` as float64."""
+        # Not cached: analyze_all would otherwise hold a copy of every numeric column
+        return self._to_float_array(self.df[column].drop_nulls())
+    
+    @staticmethod
+    def _to_float_array(series: pl.Series) -> np.ndarray:
+        data = series.to_numpy()
+        if data.dtype != np.float64:
+            data = data.astype(np.float64)
+        return data
+    
+    def _calculate_histogram(self, data: np.ndarray, bins: int = 30,
+                             data_range: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
+        # A known range spares np.histogram its own min/max scan
+        counts, edges = np.histogram(data, bins=bins, range=data_range)
         
+        # Kept as arrays until serialised (see histogram_to_lists); bin centers
+        # are left to consumers since they follow directly from the edges
         return {
-            'counts': counts.tolist(),
-            'edges': edges.tolist(),
-            'bin_centers': bin_centers.tolist(),
+            'counts': counts,
+            'edges': edges,
             'bin_width': float(edges[1] - edges[0]) if len(edges) > 1 else 0.0,
             'total_count': int(counts.sum())
         }
     
-    def _test_normality(self, series: pl.Series) -> Dict[str, Any]:
-        data = series.to_numpy().astype(float)
-        
+    def _test_normality(self, data: np.ndarray) -> Dict[str, Any]:
         if len(data) < 3:
             return {'is_normal': False, 'reason': 'insufficient_data'}
         
+        # On very large columns every tiny deviation is significant and the tests
+        # are slow; a fixed-seed subsample answers the question just as well
+        if len(data) > NORMALITY_SAMPLE_ROWS:
+            data = np.random.default_rng(0).choice(data, NORMALITY_SAMPLE_ROWS, replace=False)
+        
         results = {}
         
         try:
-            if len(data) <= 5000:
-                stat, p_value = shapiro(data)
-                results['shapiro_wilk'] = {
+            if len(data) >= 8:
+                stat, p_value = normaltest(data)
+                results['dagostino_pearson'] = {
                     'statistic': float(stat),
                     'p_value': float(p_value),
                     'is_normal': p_value > 0.05
                 }
         except Exception:
-            results['shapiro_wilk'] = None
+            results['dagostino_pearson'] = None
         
         try:
+            # With a method given, scipy reports a p-value instead of critical values
             result = anderson(data, dist='norm', method='interpolate')
-            critical_value = result.critical_values[2]
             results['anderson_darling'] = {
                 'statistic': float(result.statistic),
-                'critical_value': float(critical_value),
-                'is_normal': result.statistic < critical_value
+                'p_value': float(result.pvalue),
+                'is_normal': result.pvalue > 0.05
             }
         except Exception:
             results['anderson_darling'] = None
         
-        try:
-            if len(data) >= 8:
-                stat, p_value = normaltest(data)
-                results['dagostino_pearson'] = {
+        # Shapiro-Wilk is the costly one; it only breaks a tie between the cheaper tests
+        dagostino = results.get('dagostino_pearson')
+        anderson_result = results.get('anderson_darling')
+        if not (dagostino and anderson_result and dagostino['is_normal'] == anderson_result['is_normal']):
+            try:
+                shapiro_data = data
+                if len(shapiro_data) > SHAPIRO_MAX_ROWS:
+                    shapiro_data = np.random.default_rng(0).choice(data, SHAPIRO_MAX_ROWS, replace=False)
+                stat, p_value = shapiro(shapiro_data)
+                results['shapiro_wilk'] = {
                     'statistic': float(stat),
                     'p_value': float(p_value),
                     'is_normal': p_value > 0.05
                 }
-        except Exception:
-            results['dagostino_pearson'] = None
-        
-        try:
-            stat, p_value = kstest(data, 'norm', args=(np.mean(data), np.std(data)))
-            results['kolmogorov_smirnov'] = {
-                'statistic': float(stat),
-                'p_value': float(p_value),
-                'is_normal': p_value > 0.05
-            }
-        except Exception:
-            results['kolmogorov_smirnov'] = None
+            except Exception:
+                results['shapiro_wilk'] = None
         
         normal_votes = sum([
             test.get('is_normal', False) 
@@ -166,18 +262,15 @@ class DistributionAnalyzer:
         
         return results
     
-    def _detect_distribution_type(self, series: pl.Series, normality_tests: Dict[str, Any]) -> str:
-        data = series.to_numpy().astype(float)
-        
+    def _detect_distribution_type(self, data: np.ndarray, normality_tests: Dict[str, Any],
+                                  mean: float, std: float, skew: float, kurt: float,
+                                  data_min: float, unique_count: Optional[int] = None) -> str:
         if len(data) < 10:
             return 'unknown'
         
         if normality_tests.get('is_normal', False):
             return 'normal'
         
-        skew = float(stats.skew(data))
-        kurt = float(stats.kurtosis(data))
-        
         if abs(skew) < 0.5 and abs(kurt) < 0.5:
             return 'approximately_normal'
         
@@ -191,82 +284,45 @@ class DistributionAnalyzer:
         elif kurt < -1:
             return 'light_tailed'
         
-        unique_count = len(np.unique(data))
+        # np.unique sorts the whole column, so only fall back to it when
+        # the hash-based count from the batch query is unavailable
+        if unique_count is None:
+            unique_count = len(np.unique(data))
         if unique_count < 10:
             return 'discrete'
         
-        range_val = np.max(data) - np.min(data)
-        std_val = np.std(data)
-        cv = std_val / np.mean(data) if np.mean(data) != 0 else 0
+        cv = std / mean if mean != 0 else 0
         
         if cv < 0.1:
             return 'uniform'
         
-        if len(data[data < 0]) == 0 and skew > 0.5:
+        if data_min >= 0 and skew > 0.5:
             return 'exponential'
         
         return 'unknown'
     
-    def _calculate_skewness(self, series: pl.Series) -> float:
-        data = series.to_numpy().astype(float)
-        
-        if len(data) < 3:
-            return 0.0
-        
-        try:
-            return float(stats.skew(data))
-        except Exception:
-            return 0.0
-    
-    def _calculate_kurtosis(self, series: pl.Series) -> float:
-        data = series.to_numpy().astype(float)
-        
-        if len(data) < 4:
-            return 0.0
-        
-        try:
-            return float(stats.kurtosis(data))
-        except Exception:
-            return 0.0
-    
-    def _calculate_quartiles(self, series: pl.Series) -> Dict[str, float]:
-        try:
-            q0 = float(series.min())
-            q25 = float(series.quantile(0.25, interpolation='linear'))
-            q50 = float(series.quantile(0.50, interpolation='linear'))
-            q75 = float(series.quantile(0.75, interpolation='linear'))
-            q100 = float(series.max())
-            
-            return {
-                'min': q0,
-                'q25': q25,
-                'median': q50,
-                'q75': q75,
-                'max': q100,
-                'iqr': q75 - q25
-            }
-        except Exception:
-            return {}
-    
-    def calculate_kde(self, column: str, num_points: int = 100) -> Optional[Dict[str, List[float]]]:
-        if column not in self.df.columns:
+    def calculate_kde(self, column: str, num_points: int = 100,
+                      method: Optional[str] = None) -> Optional[Dict[str, List[float]]]:
+        if column not in self._numeric_col_set:
             return None
         
-        series = self.df[column].drop_nulls()
+        data = self._get_column_float_array(column)
         
-        if len(series) < 10:
+        if len(data) < 10:
             return None
         
-        data = series.to_numpy().astype(float)
+        if method is None:
+            method = 'fft' if len(data) > KDE_FFT_MIN_ROWS else 'exact'
         
         try:
-            kde = stats.gaussian_kde(data)
-            
             x_min, x_max = data.min(), data.max()
             padding = (x_max - x_min) * 0.1
             x_range = np.linspace(x_min - padding, x_max + padding, num_points)
             
-            y_values = kde(x_range)
+            if method == 'fft':
+                y_values = self._fft_kde(data, x_range)
+            else:
+                y_values = stats.gaussian_kde(data)(x_range)
             
             return {
                 'x': x_range.tolist(),
@@ -275,17 +331,43 @@ class DistributionAnalyzer:
         except Exception:
             return None
     
+    @staticmethod
+    def _fft_kde(data: np.ndarray, x_range: np.ndarray) -> np.ndarray:
+        """Gaussian KDE by binning onto a fine grid and convolving with the kernel via FFT.
+        
+        Uses Scott's bandwidth, as gaussian_kde does, so both methods draw the same curve.
+        """
+        n = data.size
+        bandwidth = data.std(ddof=1) * n ** (-1 / 5)
+        if not np.isfinite(bandwidth) or bandwidth <= 0:
+            raise ValueError("degenerate data for KDE")
+        
+        # Pad the grid so kernel mass near the edges is not lost
+        lo = x_range[0] - 4 * bandwidth
+        hi = x_range[-1] + 4 * bandwidth
+        counts, edges = np.histogram(data, bins=KDE_FFT_GRID, range=(lo, hi))
+        dx = edges[1] - edges[0]
+        centers = edges[:-1] + dx / 2
+        
+        offsets = np.arange(-KDE_FFT_GRID + 1, KDE_FFT_GRID) * dx
+        kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+        
+        # Zero-padded to a power of two so the circular convolution is a linear one
+        nfft = 1 << (counts.size + kernel.size - 2).bit_length()
+        conv = np.fft.irfft(np.fft.rfft(counts, nfft) * np.fft.rfft(kernel, nfft), nfft)
+        density = conv[KDE_FFT_GRID - 1:2 * KDE_FFT_GRID - 1] / n
+        
+        return np.interp(x_range, centers, np.clip(density, 0, None))
+    
     def fit_distribution(self, column: str, dist_name: str = 'norm') -> Optional[Dict[str, Any]]:
-        if column not in self.df.columns:
+        if column not in self._numeric_col_set:
             return None
         
-        series = self.df[column].drop_nulls()
+        data = self._get_column_float_array(column)
         
-        if len(series) < 10:
+        if len(data) < 10:
             return None
         
-        data = series.to_numpy().astype(float)
-        
         try:
             if dist_name == 'norm':
                 params = stats.norm.fit(data)
@@ -314,15 +396,20 @@ class DistributionAnalyzer:
         except Exception:
             return None
     
-    def get_distribution_summary(self) -> Dict[str, Any]:
-        distributions = self.analyze_all()
-        
-        normal_cols = [col for col, info in distributions.items() if info.is_normal]
-        skewed_cols = [col for col, info in distributions.items() if abs(info.skewness) > 1.0]
-        heavy_tailed_cols = [col for col, info in distributions.items() if info.kurtosis > 3]
+    def get_distribution_summary(self, bins: int = 30) -> Dict[str, Any]:
+        distributions = self.analyze_all(bins=bins)
         
+        normal_cols = []
+        skewed_cols = []
+        heavy_tailed_cols = []
         distribution_types = {}
         for col, info in distributions.items():
+            if info.is_normal:
+                normal_cols.append(col)
+            if abs(info.skewness) > 1.0:
+                skewed_cols.append(col)
+            if info.kurtosis > 3:
+                heavy_tailed_cols.append(col)
             dist_type = info.distribution_type
             distribution_types[dist_type] = distribution_types.get(dist_type, 0) + 1
         
@@ -336,6 +423,14 @@ class DistributionAnalyzer:
         }
 
 
+def histogram_to_lists(histogram: Dict[str, Any]) -> Dict[str, Any]:
+    """Histogram payload with its NumPy arrays converted to plain lists."""
+    return {
+        key: value.tolist() if isinstance(value, np.ndarray) else value
+        for key, value in histogram.items()
+    }
+
+
 def analyze_distributions(df: pl.DataFrame, bins: int = 30) -> Dict[str, DistributionInfo]:
     analyzer = DistributionAnalyzer(df)
     return analyzer.analyze_all(bins=bins)
@@ -349,31 +444,23 @@ def get_distribution_summary(df: pl.DataFrame) -> Dict[str, Any]:
 def get_histogram(df: pl.DataFrame, column: str, bins: int = 30) -> Optional[Dict[str, Any]]:
     analyzer = DistributionAnalyzer(df)
     
-    if column not in df.columns:
-        return None
-    
-    dtype = str(df[column].dtype)
-    if not any(t in dtype for t in ['Int', 'UInt', 'Float']):
+    if column not in analyzer._numeric_col_set:
         return None
     
     info = analyzer._analyze_column(column, bins=bins)
-    return info.histogram
+    return histogram_to_lists(info.histogram)
 
 
-def get_kde(df: pl.DataFrame, column: str, num_points: int = 100) -> Optional[Dict[str, List[float]]]:
+def get_kde(df: pl.DataFrame, column: str, num_points: int = 100,
+            method: Optional[str] = None) -> Optional[Dict[str, List[float]]]:
     analyzer = DistributionAnalyzer(df)
-    return analyzer.calculate_kde(column, num_points=num_points)
+    return analyzer.calculate_kde(column, num_points=num_points, method=method)
 
 
 def test_normality(df: pl.DataFrame, column: str) -> Optional[Dict[str, Any]]:
     analyzer = DistributionAnalyzer(df)
     
-    if column not in df.columns:
-        return None
-    
-    dtype = str(df[column].dtype)
-    if not any(t in dtype for t in ['Int', 'UInt', 'Float']):
+    if column not in analyzer._numeric_col_set:
         return None
     
-    series = df[column].drop_nulls()
-    return analyzer._test_normality(series)
\ No newline at end of file
+    return analyzer._test_normality(analyzer._get_column_float_array(column))
\ No newline at end of file
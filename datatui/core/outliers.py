@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from sklearn.ensemble import IsolationForest
 
 
-@dataclass
+@dataclass(slots=True)
 class OutlierInfo:
     column_name: str
     total_count: int
@@ -23,7 +23,7 @@ class OutlierInfo:
     outlier_values: List[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class MultivariatOutlierInfo:
     total_count: int
     outlier_indices: List[int]
@@ -53,12 +53,7 @@ class OutlierDetector:
         return outliers
     
     def _get_numeric_columns(self) -> List[str]:
-        numeric_cols = []
-        for col in self.df.columns:
-            dtype = str(self.df[col].dtype)
-            if any(t in dtype for t in ['Int', 'UInt', 'Float']):
-                numeric_cols.append(col)
-        return numeric_cols
+        return [col for col, dtype in self.df.schema.items() if dtype.is_numeric()]
     
     def _detect_column_outliers(
         self, 
@@ -197,6 +192,7 @@ class OutlierDetector:
                 contamination=contamination
             )
         
+        # n_jobs defaults to None (one core); -1 builds and scores the trees in parallel
         iso_forest = IsolationForest(
             contamination=contamination,
             random_state=random_state,
@@ -205,7 +201,7 @@ class OutlierDetector:
         
         predictions = iso_forest.fit_predict(X)
         
-        outlier_indices = [i for i, pred in enumerate(predictions) if pred == -1]
+        outlier_indices = np.flatnonzero(predictions == -1).tolist()
         outlier_count = len(outlier_indices)
         outlier_percentage = (outlier_count / len(df_subset) * 100) if len(df_subset) > 0 else 0.0
         
@@ -271,8 +267,7 @@ def get_outliers_for_column(df: pl.DataFrame, column: str) -> Dict[str, Any]:
     if column not in df.columns:
         return {'error': f'Column {column} not found'}
     
-    dtype = str(df[column].dtype)
-    if not any(t in dtype for t in ['Int', 'UInt', 'Float']):
+    if not df.schema[column].is_numeric():
         return {'error': f'Column {column} is not numeric'}
     
     info = detector._detect_column_outliers(column)
@@ -1,10 +1,61 @@
 import polars as pl
+import numpy as np
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
-import math
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import io
+import multiprocessing
+import os
 
+# Below these sizes the thread pool costs more than it saves
+PARALLEL_MIN_COLUMNS = 8
+PARALLEL_MIN_ROWS = 10_000
 
-@dataclass
+# Many tall categorical/text columns are worth shipping to worker processes
+PROCESS_MIN_COLUMNS = 64
+PROCESS_MIN_ROWS = 100_000
+
+# Per-column aggregations fused into the batched numeric select
+_NUMERIC_AGGS = {
+    'count': lambda col: col.count(),
+    'null_count': lambda col: col.null_count(),
+    'mean': lambda col: col.mean(),
+    'median': lambda col: col.median(),
+    'std': lambda col: col.std(),
+    'var': lambda col: col.var(),
+    'min': lambda col: col.min(),
+    'max': lambda col: col.max(),
+    'sum': lambda col: col.sum(),
+    'q25': lambda col: col.quantile(0.25, interpolation='linear'),
+    'q50': lambda col: col.quantile(0.5, interpolation='linear'),
+    'q75': lambda col: col.quantile(0.75, interpolation='linear'),
+    # One pass buckets every value by sign; imploded so it stays a single row
+    'signs': lambda col: col.sign().value_counts().implode(),
+    # Polars shares the (col - mean) term between the two central moments
+    'm3': lambda col: ((col - col.mean()) ** 3).mean(),
+    'm4': lambda col: ((col - col.mean()) ** 4).mean(),
+    'mode': lambda col: col.drop_nulls().mode().first(),
+}
+
+_DATETIME_AGGS = {
+    'count': lambda col: col.count(),
+    'null_count': lambda col: col.null_count(),
+    'min': lambda col: col.min(),
+    'max': lambda col: col.max(),
+    'unique_count': lambda col: col.drop_nulls().n_unique(),
+    'mode': lambda col: col.drop_nulls().mode().first(),
+}
+
+# Cardinality profile used to split the remaining columns into categorical and text;
+# the 5% threshold only needs an estimate, so HyperLogLog stands in for an exact count
+_CARDINALITY_AGGS = {
+    'count': lambda col: col.count(),
+    'null_count': lambda col: col.null_count(),
+    'unique_count': lambda col: col.approx_n_unique(),
+}
+
+
+@dataclass(slots=True, frozen=True)
 class NumericStats:
     count: int
     null_count: int
@@ -29,7 +80,7 @@ class NumericStats:
     positive_count: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CategoricalStats:
     count: int
     null_count: int
@@ -42,7 +93,7 @@ class CategoricalStats:
     is_unique: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatetimeStats:
     count: int
     null_count: int
@@ -53,7 +104,7 @@ class DatetimeStats:
     unique_count: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TextStats:
     count: int
     null_count: int
@@ -71,47 +122,154 @@ class StatisticsAnalyzer:
     def __init__(self, df: pl.DataFrame):
         self.df = df
         self.total_rows = len(df)
+        self._dtype_cache: Dict[pl.DataType, str] = {}
+        # Column -> 'numeric' / 'categorical' / 'datetime' / 'text', filled by analyze_all
+        self._type_map: Dict[str, str] = {}
     
     def analyze_all(self) -> Dict[str, Any]:
+        groups = {'numeric': [], 'datetime': [], 'other': []}
+        for col, dtype in self.df.schema.items():
+            groups[self._classify_dtype(dtype)].append(col)
+        numeric_cols, datetime_cols, other_cols = groups['numeric'], groups['datetime'], groups['other']
+        
+        stats = {}
+        if numeric_cols:
+            stats.update(self._analyze_numeric_batch(numeric_cols))
+        if datetime_cols:
+            stats.update(self._analyze_datetime_batch(datetime_cols))
+        
+        type_map = {col: kind for kind in ('numeric', 'datetime') for col in groups[kind]}
+        
+        if other_cols:
+            categorical = self._categorical_columns(other_cols)
+            type_map.update((col, 'categorical' if col in categorical else 'text') for col in other_cols)
+            wanted = set(other_cols)
+            # Walk the frame's columns directly rather than looking each one up by name
+            tasks = [
+                (self._analyze_categorical if name in categorical else self._analyze_text, name, series)
+                for name, series in zip(self.df.columns, self.df.get_columns())
+                if name in wanted
+            ]
+            
+            # value_counts tables are per column, so these still run column by column
+            if len(tasks) > PROCESS_MIN_COLUMNS and self.total_rows > PROCESS_MIN_ROWS:
+                stats.update(self._analyze_in_processes(other_cols, categorical))
+            elif len(tasks) < PARALLEL_MIN_COLUMNS or self.total_rows < PARALLEL_MIN_ROWS:
+                stats.update((name, analyze(series)) for analyze, name, series in tasks)
+            else:
+                # Polars releases the GIL inside its kernels, so columns overlap across threads
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    results = executor.map(lambda task: task[0](task[2]), tasks)
+                    stats.update(zip((name for _, name, _ in tasks), results))
+        
+        self._type_map = {col: type_map[col] for col in self.df.columns}
+        return {col: stats[col] for col in self.df.columns}
+    
+    def _analyze_in_processes(self, columns: List[str], categorical: set) -> Dict[str, Any]:
+        # The Python-side top-k and result building hold the GIL, so threads stop
+        # scaling here. Each worker gets an Arrow IPC slice of its columns instead
+        # of a pickled frame.
+        workers = min(os.cpu_count() or 1, len(columns))
+        payloads = []
+        for i in range(workers):
+            chunk = columns[i::workers]
+            buffer = io.BytesIO()
+            self.df.select(chunk).write_ipc(buffer)
+            payloads.append((buffer.getvalue(), categorical.intersection(chunk)))
+        
+        # Polars' thread pool is not fork-safe, so workers are spawned
+        context = multiprocessing.get_context("spawn")
         stats = {}
-        for col in self.df.columns:
-            stats[col] = self.analyze_column(col)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            for result in executor.map(_analyze_ipc_chunk, payloads):
+                stats.update(result)
         return stats
     
     def analyze_column(self, column: str) -> Dict[str, Any]:
-        series = self.df[column]
-        dtype = str(series.dtype)
-        
-        if self._is_numeric(dtype):
-            return self._analyze_numeric(series)
-        elif self._is_datetime(dtype):
-            return self._analyze_datetime(series)
-        elif self._is_categorical(series):
+        return self._analyze_series(column, self.df[column])
+    
+    def _analyze_series(self, name: str, series: pl.Series) -> Dict[str, Any]:
+        dispatch = {
+            'numeric': self._analyze_numeric,
+            'datetime': self._analyze_datetime,
+            'other': self._analyze_other,
+        }
+        return dispatch[self._classify_dtype(series.dtype)](series)
+    
+    def _analyze_other(self, series: pl.Series) -> Dict[str, Any]:
+        if self._is_categorical(series):
             return self._analyze_categorical(series)
-        else:
-            return self._analyze_text(series)
+        return self._analyze_text(series)
     
-    def _is_numeric(self, dtype: str) -> bool:
-        return any(t in dtype for t in ['Int', 'UInt', 'Float'])
+    def _classify_dtype(self, dtype: pl.DataType) -> str:
+        # Wide frames repeat a handful of dtypes, so each is classified once
+        kind = self._dtype_cache.get(dtype)
+        if kind is None:
+            if self._is_numeric(dtype):
+                kind = 'numeric'
+            elif self._is_datetime(dtype):
+                kind = 'datetime'
+            else:
+                kind = 'other'
+            self._dtype_cache[dtype] = kind
+        return kind
     
-    def _is_datetime(self, dtype: str) -> bool:
-        return any(t in dtype for t in ['Date', 'Datetime', 'Time'])
+    def _is_numeric(self, dtype: pl.DataType) -> bool:
+        return dtype.is_numeric()
+    
+    def _is_datetime(self, dtype: pl.DataType) -> bool:
+        return dtype.is_temporal()
     
     def _is_categorical(self, series: pl.Series) -> bool:
-        if 'Categorical' in str(series.dtype):
-            return True
+        return series.name in self._categorical_columns([series.name])
+    
+    def _categorical_columns(self, columns: List[str]) -> set:
+        categorical = {col for col in columns if self.df.schema[col] == pl.Categorical}
+        candidates = [col for col in columns if col not in categorical]
         
-        non_null = series.drop_nulls()
-        if len(non_null) == 0:
+        if candidates:
+            categorical.update(self._low_cardinality_columns(candidates))
+        return categorical
+    
+    def _low_cardinality_columns(self, columns: List[str]) -> List[str]:
+        profile = self._batch_aggregate(columns, _CARDINALITY_AGGS)
+        # Nulls count as one distinct value in the estimate
+        return [
+            col for col, aggs in profile.items()
+            if self._is_low_cardinality(aggs['unique_count'] - (aggs['null_count'] > 0), aggs['count'])
+        ]
+    
+    def _is_low_cardinality(self, unique_count: int, count: int) -> bool:
+        if count == 0:
             return False
         
-        unique_ratio = non_null.n_unique() / len(non_null)
-        return unique_ratio <= 0.05
+        return unique_count / count <= 0.05
     
     def _analyze_numeric(self, series: pl.Series) -> NumericStats:
-        non_null = series.drop_nulls()
-        count = len(non_null)
-        null_count = series.null_count()
+        return self._analyze_numeric_batch([series.name])[series.name]
+    
+    def _analyze_numeric_batch(self, numeric_cols: List[str]) -> Dict[str, NumericStats]:
+        return {
+            col: self._build_numeric_stats(aggs)
+            for col, aggs in self._batch_aggregate(numeric_cols, _NUMERIC_AGGS).items()
+        }
+    
+    def _batch_aggregate(self, columns: List[str], aggs: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        # One select streams each column once; polars evaluates the expressions in parallel.
+        # Running it as a lazy plan lets the optimizer share common subexpressions
+        # such as (col - mean) between the central moments.
+        exprs = [
+            agg(pl.col(col)).alias(f"{col}__{name}")
+            for col in columns
+            for name, agg in aggs.items()
+        ]
+        row = self.df.lazy().select(exprs).collect().row(0, named=True)
+        
+        return {col: {name: row[f"{col}__{name}"] for name in aggs} for col in columns}
+    
+    def _build_numeric_stats(self, aggs: Dict[str, Any]) -> NumericStats:
+        count = int(aggs['count'])
+        null_count = int(aggs['null_count'])
         
         if count == 0:
             return NumericStats(
@@ -138,31 +296,28 @@ class StatisticsAnalyzer:
                 positive_count=0
             )
         
-        mean = float(non_null.mean())
-        median = float(non_null.median())
-        std = float(non_null.std())
-        variance = float(non_null.var())
-        min_val = float(non_null.min())
-        max_val = float(non_null.max())
+        mean = float(aggs['mean'])
+        median = float(aggs['median'])
+        # std/var are null for a single observation
+        std = float(aggs['std'] or 0.0)
+        variance = float(aggs['var'] or 0.0)
+        min_val = float(aggs['min'])
+        max_val = float(aggs['max'])
         range_val = max_val - min_val
-        total_sum = float(non_null.sum())
+        total_sum = float(aggs['sum'])
         
-        quantiles = non_null.quantile([0.25, 0.5, 0.75], interpolation='linear')
-        q25 = float(quantiles[0])
-        q50 = float(quantiles[1])
-        q75 = float(quantiles[2])
+        q25 = float(aggs['q25'])
+        q50 = float(aggs['q50'])
+        q75 = float(aggs['q75'])
         iqr = q75 - q25
         
-        mode_val = self._calculate_mode(non_null)
+        mode_val = aggs['mode']
         
-        skewness = self._calculate_skewness(non_null, mean, std, count)
-        kurtosis = self._calculate_kurtosis(non_null, mean, std, count)
+        skewness, kurtosis = self._calculate_higher_moments(aggs['m3'], aggs['m4'], std, count)
         
         cv = (std / mean) if mean != 0 else 0.0
         
-        zero_count = int((non_null == 0).sum())
-        negative_count = int((non_null < 0).sum())
-        positive_count = int((non_null > 0).sum())
+        zero_count, negative_count, positive_count = self._bucket_signs(aggs['signs'])
         
         return NumericStats(
             count=count,
@@ -189,10 +344,8 @@ class StatisticsAnalyzer:
         )
     
     def _analyze_categorical(self, series: pl.Series) -> CategoricalStats:
-        non_null = series.drop_nulls()
+        non_null, null_count = self._split_nulls(series)
         count = len(non_null)
-        null_count = series.null_count()
-        unique_count = non_null.n_unique()
         
         if count == 0:
             return CategoricalStats(
@@ -207,27 +360,23 @@ class StatisticsAnalyzer:
                 is_unique=False
             )
         
-        value_counts = non_null.value_counts().sort('count', descending=True)
+        value_counts = non_null.value_counts()
+        unique_count = value_counts.height
+        top_counts = self._top_counts(value_counts)
         
         mode = None
         mode_frequency = 0
         mode_percentage = 0.0
         
-        if len(value_counts) > 0:
-            mode_row = value_counts.row(0)
+        if len(top_counts) > 0:
+            mode_row = top_counts.row(0)
             mode = str(mode_row[0])
             mode_frequency = int(mode_row[1])
             mode_percentage = (mode_frequency / count) * 100
         
-        top_values = []
-        for i in range(min(10, len(value_counts))):
-            row = value_counts.row(i)
-            value = str(row[0])
-            freq = int(row[1])
-            pct = (freq / count) * 100
-            top_values.append((value, freq, pct))
+        top_values = self._top_values(top_counts, count)
         
-        entropy = self._calculate_entropy(value_counts['count'].to_list(), count)
+        entropy = self._calculate_entropy(value_counts['count'], count)
         
         is_unique = (unique_count == count)
         
@@ -244,9 +393,17 @@ class StatisticsAnalyzer:
         )
     
     def _analyze_datetime(self, series: pl.Series) -> DatetimeStats:
-        non_null = series.drop_nulls()
-        count = len(non_null)
-        null_count = series.null_count()
+        return self._analyze_datetime_batch([series.name])[series.name]
+    
+    def _analyze_datetime_batch(self, datetime_cols: List[str]) -> Dict[str, DatetimeStats]:
+        return {
+            col: self._build_datetime_stats(aggs)
+            for col, aggs in self._batch_aggregate(datetime_cols, _DATETIME_AGGS).items()
+        }
+    
+    def _build_datetime_stats(self, aggs: Dict[str, Any]) -> DatetimeStats:
+        count = int(aggs['count'])
+        null_count = int(aggs['null_count'])
         
         if count == 0:
             return DatetimeStats(
@@ -259,9 +416,9 @@ class StatisticsAnalyzer:
                 unique_count=0
             )
         
-        min_val = non_null.min()
-        max_val = non_null.max()
-        unique_count = non_null.n_unique()
+        min_val = aggs['min']
+        max_val = aggs['max']
+        unique_count = int(aggs['unique_count'])
         
         range_days = None
         try:
@@ -274,7 +431,7 @@ class StatisticsAnalyzer:
         except:
             pass
         
-        mode_val = self._calculate_mode(non_null)
+        mode_val = aggs['mode']
         
         return DatetimeStats(
             count=count,
@@ -287,10 +444,8 @@ class StatisticsAnalyzer:
         )
     
     def _analyze_text(self, series: pl.Series) -> TextStats:
-        non_null = series.drop_nulls()
+        non_null, null_count = self._split_nulls(series)
         count = len(non_null)
-        null_count = series.null_count()
-        unique_count = non_null.n_unique()
         
         if count == 0:
             return TextStats(
@@ -305,26 +460,28 @@ class StatisticsAnalyzer:
                 top_values=[]
             )
         
-        lengths = non_null.str.len_chars()
-        avg_length = float(lengths.mean())
-        min_length = int(lengths.min())
-        max_length = int(lengths.max())
-        
-        empty_count = int((lengths == 0).sum())
-        
-        value_counts = non_null.value_counts().sort('count', descending=True)
-        
-        mode = None
-        if len(value_counts) > 0:
-            mode = str(value_counts.row(0)[0])
-        
-        top_values = []
-        for i in range(min(10, len(value_counts))):
-            row = value_counts.row(i)
-            value = str(row[0])
-            freq = int(row[1])
-            pct = (freq / count) * 100
-            top_values.append((value, freq, pct))
+        # Polars reuses the len_chars term across all four aggregations
+        lengths = pl.col('t').str.len_chars()
+        avg_length, min_length, max_length, empty_count = non_null.to_frame('t').select([
+            lengths.mean(),
+            lengths.min().alias('min'),
+            lengths.max().alias('max'),
+            (lengths == 0).sum().alias('empty'),
+        ]).row(0)
+        avg_length = float(avg_length)
+        min_length = int(min_length)
+        max_length = int(max_length)
+        empty_count = int(empty_count)
+        
+        value_counts = non_null.value_counts()
+        unique_count = value_counts.height
+        top_counts = self._top_counts(value_counts)
+        
+        mode = self._calculate_mode_from_vc(top_counts)
+        if mode is not None:
+            mode = str(mode)
+        
+        top_values = self._top_values(top_counts, count)
         
         return TextStats(
             count=count,
@@ -338,81 +495,85 @@ class StatisticsAnalyzer:
             top_values=top_values
         )
     
-    def _calculate_mode(self, series: pl.Series) -> Optional[Any]:
-        if len(series) == 0:
-            return None
-        
-        value_counts = series.value_counts()
-        if len(value_counts) == 0:
+    def _split_nulls(self, series: pl.Series) -> tuple:
+        # null_count is read from column metadata; skip the copy for dense columns
+        null_count = series.null_count()
+        return (series.drop_nulls() if null_count else series), null_count
+    
+    def _top_counts(self, value_counts: pl.DataFrame, k: int = 10) -> pl.DataFrame:
+        # Partial selection on the unsorted counts; only the k winners get ordered
+        counts = value_counts['count'].to_numpy().astype(np.int64)
+        if len(counts) > k:
+            top_idx = np.argpartition(counts, len(counts) - k)[-k:]
+        else:
+            top_idx = np.arange(len(counts))
+        top_idx = top_idx[np.argsort(-counts[top_idx], kind='stable')]
+        return value_counts[top_idx]
+    
+    def _top_values(self, top_counts: pl.DataFrame, count: int) -> List[tuple]:
+        # Pull both columns out once rather than materialising a tuple per row
+        values = top_counts.to_series(0).to_list()
+        freqs = top_counts['count'].to_list()
+        return [(str(v), f, f * 100.0 / count) for v, f in zip(values, freqs)]
+    
+    def _calculate_mode_from_vc(self, value_counts: pl.DataFrame) -> Optional[Any]:
+        # Expects the most frequent value in the first row
+        if value_counts.height == 0:
             return None
         
-        value_counts = value_counts.sort('count', descending=True)
-        mode_val = value_counts.row(0)[0]
-        
-        return mode_val
+        return value_counts.row(0)[0]
     
-    def _calculate_skewness(self, series: pl.Series, mean: float, std: float, n: int) -> float:
-        if n < 3 or std == 0:
-            return 0.0
-        
-        try:
-            m3 = ((series - mean) ** 3).mean()
-            skew = float(m3 / (std ** 3))
-            return skew
-        except:
-            return 0.0
+    def _bucket_signs(self, sign_counts: List[Dict[str, Any]]) -> tuple:
+        buckets = {-1: 0, 0: 0, 1: 0}
+        for sign, freq in (tuple(entry.values()) for entry in sign_counts):
+            if sign is None:
+                continue
+            # NaN > 0 is true in Polars, so NaN counts as positive
+            if sign != sign:
+                sign = 1
+            buckets[int(sign)] += int(freq)
+        return buckets[0], buckets[-1], buckets[1]
     
-    def _calculate_kurtosis(self, series: pl.Series, mean: float, std: float, n: int) -> float:
-        if n < 4 or std == 0:
-            return 0.0
-        
-        try:
-            m4 = ((series - mean) ** 4).mean()
-            kurt = float(m4 / (std ** 4)) - 3.0
-            return kurt
-        except:
-            return 0.0
+    def _calculate_higher_moments(self, m3: Optional[float], m4: Optional[float], std: float, n: int) -> tuple:
+        skew = float(m3 / (std ** 3)) if n >= 3 and std != 0 and m3 is not None else 0.0
+        kurt = float(m4 / (std ** 4)) - 3.0 if n >= 4 and std != 0 and m4 is not None else 0.0
+        return skew, kurt
     
-    def _calculate_entropy(self, counts: List[int], total: int) -> float:
+    def _calculate_entropy(self, counts: pl.Series, total: int) -> float:
         if total == 0:
             return 0.0
         
-        entropy = 0.0
-        for count in counts:
-            if count > 0:
-                p = count / total
-                entropy -= p * math.log2(p)
-        
-        return entropy
+        arr = counts.to_numpy()
+        p = arr[arr > 0] / total
+        return float(-(p * np.log2(p)).sum())
     
     def get_summary(self) -> Dict[str, Any]:
         all_stats = self.analyze_all()
         
-        numeric_cols = []
-        categorical_cols = []
-        datetime_cols = []
-        text_cols = []
-        
-        for col, stats in all_stats.items():
-            if isinstance(stats, NumericStats):
-                numeric_cols.append(col)
-            elif isinstance(stats, CategoricalStats):
-                categorical_cols.append(col)
-            elif isinstance(stats, DatetimeStats):
-                datetime_cols.append(col)
-            elif isinstance(stats, TextStats):
-                text_cols.append(col)
+        # analyze_all already classified every column; no need to re-inspect the results
+        columns_by_type = {'numeric': [], 'categorical': [], 'datetime': [], 'text': []}
+        for col, kind in self._type_map.items():
+            columns_by_type[kind].append(col)
         
         return {
             'total_columns': len(all_stats),
-            'numeric_columns': numeric_cols,
-            'categorical_columns': categorical_cols,
-            'datetime_columns': datetime_cols,
-            'text_columns': text_cols,
+            'numeric_columns': columns_by_type['numeric'],
+            'categorical_columns': columns_by_type['categorical'],
+            'datetime_columns': columns_by_type['datetime'],
+            'text_columns': columns_by_type['text'],
             'statistics': all_stats
         }
 
 
+def _analyze_ipc_chunk(payload: tuple) -> Dict[str, Any]:
+    buffer, categorical = payload
+    analyzer = StatisticsAnalyzer(pl.read_ipc(io.BytesIO(buffer)))
+    return {
+        name: (analyzer._analyze_categorical if name in categorical else analyzer._analyze_text)(series)
+        for name, series in zip(analyzer.df.columns, analyzer.df.get_columns())
+    }
+
+
 def analyze_statistics(df: pl.DataFrame) -> Dict[str, Any]:
     analyzer = StatisticsAnalyzer(df)
     return analyzer.analyze_all()
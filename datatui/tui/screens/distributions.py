@@ -197,7 +197,7 @@ class DistributionsScreen(Screen):
         
         normality = info.get("normality_tests", {})
         if normality:
-            for test_name in ("shapiro_wilk", "anderson_darling", "dagostino_pearson", "kolmogorov_smirnov"):
+            for test_name in ("shapiro_wilk", "anderson_darling", "dagostino_pearson"):
                 test = normality.get(test_name)
                 if test and isinstance(test, dict):
                     stat = test.get("statistic", 0)
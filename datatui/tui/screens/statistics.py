@@ -1,3 +1,7 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
 from textual.screen import Screen
 from textual.app import ComposeResult
 from textual.containers import ScrollableContainer, Vertical, Horizontal
@@ -10,6 +14,71 @@ from datatui.tui.widgets.mini_chart import MiniChart
 
 __all__ = ["StatisticsScreen"]
 
+_fmt4 = "{:.4f}".format
+_fmt3 = "{:.3f}".format
+_fmt1 = "{:.1f}".format
+_fmtn = "{:,}".format
+_fmtp = "{:.2f}%".format
+
+
+def _skew_cell(skew_val: float) -> Text:
+    if abs(skew_val) < 0.5: skew_color = "green"
+    elif abs(skew_val) < 1.0: skew_color = "yellow"
+    else: skew_color = "red"
+    return Text(_fmt3(skew_val), style=skew_color)
+
+
+# (title, key, cell extractor) per table column
+NUMERIC_SPEC = [
+    ("Column", "column", lambda n, s: n),
+    ("Count", "count", lambda n, s: _fmtn(s.count)),
+    ("Mean", "mean", lambda n, s: _fmt4(s.mean)),
+    ("Std", "std", lambda n, s: _fmt4(s.std)),
+    ("Min", "min", lambda n, s: _fmt4(s.min)),
+    ("Q25", "q25", lambda n, s: _fmt4(s.q25)),
+    ("Median", "median", lambda n, s: _fmt4(s.median)),
+    ("Q75", "q75", lambda n, s: _fmt4(s.q75)),
+    ("Max", "max", lambda n, s: _fmt4(s.max)),
+    ("Skew", "skew", lambda n, s: _skew_cell(s.skewness)),
+    ("Kurt", "kurt", lambda n, s: _fmt3(s.kurtosis)),
+]
+
+CAT_SPEC = [
+    ("Column", "column", lambda n, s: n),
+    ("Count", "count", lambda n, s: _fmtn(s.count)),
+    ("Unique", "unique", lambda n, s: _fmtn(s.unique_count)),
+    ("Mode", "mode", lambda n, s: str(s.mode) if s.mode else "-"),
+    ("Mode Freq", "mode_freq", lambda n, s: _fmtn(s.mode_frequency)),
+    ("Mode %", "mode_pct", lambda n, s: _fmtp(s.mode_percentage)),
+    ("Entropy", "entropy", lambda n, s: _fmt3(s.entropy)),
+]
+
+DT_SPEC = [
+    ("Column", "column", lambda n, s: n),
+    ("Count", "count", lambda n, s: _fmtn(s.count)),
+    ("Min", "min", lambda n, s: str(s.min)),
+    ("Max", "max", lambda n, s: str(s.max)),
+    ("Range (days)", "range", lambda n, s: _fmt1(s.range_days) if s.range_days is not None else "-"),
+    ("Unique", "unique", lambda n, s: _fmtn(s.unique_count)),
+]
+
+TEXT_SPEC = [
+    ("Column", "column", lambda n, s: n),
+    ("Count", "count", lambda n, s: _fmtn(s.count)),
+    ("Unique", "unique", lambda n, s: _fmtn(s.unique_count)),
+    ("Mode", "mode", lambda n, s: str(s.mode)[:30] if s.mode else "-"),
+    ("Avg Len", "avg_len", lambda n, s: _fmt1(s.avg_length)),
+    ("Min Len", "min_len", lambda n, s: str(s.min_length)),
+    ("Max Len", "max_len", lambda n, s: str(s.max_length)),
+    ("Empty", "empty", lambda n, s: _fmtn(s.empty_count)),
+]
+
+
+@dataclass
+class StatsPayload:
+    stats: dict = field(default_factory=dict)
+    error: Optional[str] = None
+
 
 class StatisticsScreen(Screen):
 
@@ -41,153 +110,91 @@ class StatisticsScreen(Screen):
         self.load_data()
 
     def load_data(self) -> None:
+        if getattr(self, "_in_flight", False):
+            return
+        self._in_flight = True
+
         loading = self.query_one("#statistics-loading", LoadingIndicator)
-        content = self.query_one("#statistics-content")
         loading.display = True
-        content.display = False
         self._load_data_worker()
 
     @work(exclusive=True, thread=True)
     def _load_data_worker(self) -> None:
         analyzer = self.app.analyzer
         if analyzer is None:
+            self._in_flight = False
             return
 
         try:
             statistics = analyzer.analyze_statistics()
-            # We also need histogram data for numeric columns for the detail view
-            # The analyzer might not compute histograms by default in analyze_statistics
-            # We can fetch them on demand or pre-compute.
-            # For now let's assume we can get distribution data or compute it on selection?
-            # Computing on selection in UI thread is bad if heavy.
-            # Best to compute basic histograms now or use existing data.
-            # analyze_statistics might not have histograms. analyze_distributions does.
-            # Let's try to get distributions too if cheap, or just raw data access on selection (since it is worker thread? No selection is main thread).
-            # Actually, `NumericStats` in `datatui.core.statistics` likely has `histogram` if we added it, or we can compute it from df.
-            # Safe bet: access df in selection handler (main thread) but keep it light (sample?).
-            # Or run a worker on selection.
-            
-            self.app.call_from_thread(self._render_statistics, statistics)
+            payload = StatsPayload(stats=statistics)
         except Exception as e:
-            self.app.call_from_thread(self._render_error, str(e))
+            payload = StatsPayload(error=str(e))
+
+        self.app.call_from_thread(self._render_all, payload)
+
+    def _render_all(self, payload: StatsPayload) -> None:
+        if payload.error is not None:
+            self._render_error(payload.error)
+            return
+
+        self._histograms = {}
+        self._render_statistics(payload.stats)
 
     def _render_statistics(self, statistics):
+        self._in_flight = False
         loading = self.query_one("#statistics-loading", LoadingIndicator)
-        content = self.query_one("#statistics-content")
         loading.display = False
-        content.display = True
 
         self._stats_data = statistics.get("statistics", {})
 
-        numeric_table = self.query_one("#numeric-stats-table", DataTable)
-        numeric_table.clear(columns=True)
-        numeric_table.add_column("Column", key="column")
-        numeric_table.add_column("Count", key="count")
-        numeric_table.add_column("Mean", key="mean")
-        numeric_table.add_column("Std", key="std")
-        numeric_table.add_column("Min", key="min")
-        numeric_table.add_column("Q25", key="q25")
-        numeric_table.add_column("Median", key="median")
-        numeric_table.add_column("Q75", key="q75")
-        numeric_table.add_column("Max", key="max")
-        numeric_table.add_column("Skew", key="skew")
-        numeric_table.add_column("Kurt", key="kurt")
-
+        # Bucket columns once; each tab's table is only filled when it is shown
+        self._numeric_stats = []
+        self._categorical_stats = []
+        self._datetime_stats = []
+        self._text_stats = []
         for col_name, col_stats in self._stats_data.items():
             if isinstance(col_stats, NumericStats):
-                skew_val = col_stats.skewness
-                if abs(skew_val) < 0.5: skew_color = "green"
-                elif abs(skew_val) < 1.0: skew_color = "yellow"
-                else: skew_color = "red"
-                
-                skew_cell = Text(f"{skew_val:.3f}", style=skew_color)
-                
-                numeric_table.add_row(
-                    col_name,
-                    f"{col_stats.count:,}",
-                    f"{col_stats.mean:.4f}",
-                    f"{col_stats.std:.4f}",
-                    f"{col_stats.min:.4f}",
-                    f"{col_stats.q25:.4f}",
-                    f"{col_stats.median:.4f}",
-                    f"{col_stats.q75:.4f}",
-                    f"{col_stats.max:.4f}",
-                    skew_cell,
-                    f"{col_stats.kurtosis:.3f}",
-                    key=col_name
-                )
-
-        cat_table = self.query_one("#categorical-stats-table", DataTable)
-        cat_table.clear(columns=True)
-        cat_table.add_column("Column", key="column")
-        cat_table.add_column("Count", key="count")
-        cat_table.add_column("Unique", key="unique")
-        cat_table.add_column("Mode", key="mode")
-        cat_table.add_column("Mode Freq", key="mode_freq")
-        cat_table.add_column("Mode %", key="mode_pct")
-        cat_table.add_column("Entropy", key="entropy")
+                self._numeric_stats.append((col_name, col_stats))
+            elif isinstance(col_stats, CategoricalStats):
+                self._categorical_stats.append((col_name, col_stats))
+            elif isinstance(col_stats, DatetimeStats):
+                self._datetime_stats.append((col_name, col_stats))
+            elif isinstance(col_stats, TextStats):
+                self._text_stats.append((col_name, col_stats))
 
-        for col_name, col_stats in self._stats_data.items():
-            if isinstance(col_stats, CategoricalStats):
-                cat_table.add_row(
-                    col_name,
-                    f"{col_stats.count:,}",
-                    f"{col_stats.unique_count:,}",
-                    str(col_stats.mode) if col_stats.mode else "-",
-                    f"{col_stats.mode_frequency:,}",
-                    f"{col_stats.mode_percentage:.2f}%",
-                    f"{col_stats.entropy:.3f}",
-                    key=col_name
-                )
-                
-        # Datetime and Text tables (simpler)
-        dt_table = self.query_one("#datetime-stats-table", DataTable)
-        dt_table.clear(columns=True)
-        dt_table.add_column("Column", key="column")
-        dt_table.add_column("Count", key="count")
-        dt_table.add_column("Min", key="min")
-        dt_table.add_column("Max", key="max")
-        dt_table.add_column("Range (days)", key="range")
-        dt_table.add_column("Unique", key="unique")
+        self._tab_filled = set()
+        tabs = self.query_one("#stats-tabs", TabbedContent)
+        self._fill_tab(tabs.active or "tab-numeric")
 
-        for col_name, col_stats in self._stats_data.items():
-             if isinstance(col_stats, DatetimeStats):
-                range_str = f"{col_stats.range_days:.1f}" if col_stats.range_days is not None else "-"
-                dt_table.add_row(
-                    col_name,
-                    f"{col_stats.count:,}",
-                    str(col_stats.min),
-                    str(col_stats.max),
-                    range_str,
-                    f"{col_stats.unique_count:,}",
-                    key=col_name
-                )
-
-        text_table = self.query_one("#text-stats-table", DataTable)
-        text_table.clear(columns=True)
-        text_table.add_column("Column", key="column")
-        text_table.add_column("Count", key="count")
-        text_table.add_column("Unique", key="unique")
-        text_table.add_column("Mode", key="mode")
-        text_table.add_column("Avg Len", key="avg_len")
-        text_table.add_column("Min Len", key="min_len")
-        text_table.add_column("Max Len", key="max_len")
-        text_table.add_column("Empty", key="empty")
-        
-        for col_name, col_stats in self._stats_data.items():
-             if isinstance(col_stats, TextStats):
-                mode_val = str(col_stats.mode)[:30] if col_stats.mode else "-"
-                text_table.add_row(
-                    col_name,
-                    f"{col_stats.count:,}",
-                    f"{col_stats.unique_count:,}",
-                    mode_val,
-                    f"{col_stats.avg_length:.1f}",
-                    str(col_stats.min_length),
-                    str(col_stats.max_length),
-                    f"{col_stats.empty_count:,}",
-                    key=col_name
-                )
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        if event.pane is not None:
+            self._fill_tab(event.pane.id)
+
+    def _fill_tab(self, pane_id) -> None:
+        if not hasattr(self, "_tab_filled") or pane_id in self._tab_filled:
+            return
+
+        tables = {
+            "tab-numeric": ("numeric-stats-table", NUMERIC_SPEC, self._numeric_stats),
+            "tab-categorical": ("categorical-stats-table", CAT_SPEC, self._categorical_stats),
+            "tab-datetime": ("datetime-stats-table", DT_SPEC, self._datetime_stats),
+            "tab-text": ("text-stats-table", TEXT_SPEC, self._text_stats),
+        }
+        if pane_id not in tables:
+            return
+
+        self._tab_filled.add(pane_id)
+        self._fill(*tables[pane_id])
+
+    def _fill(self, table_id, spec, stats_iter) -> None:
+        table = self.query_one(f"#{table_id}", DataTable)
+        table.clear(columns=True)
+        for title, key, _ in spec:
+            table.add_column(title, key=key)
+        # Rows are keyed by column name so row selection can look up the stats
+        for col_name, col_stats in stats_iter:
+            table.add_row(*(cell(col_name, col_stats) for _, _, cell in spec), key=col_name)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         if not hasattr(self, "_stats_data"):
@@ -206,46 +213,64 @@ class StatisticsScreen(Screen):
         detail_chart = self.query_one("#stats-detail-chart", Static)
         
         detail_text.update(f"[bold]{row_key}[/]")
+        self._selected_column = row_key
         
         if isinstance(col_stats, NumericStats):
-            # Compute histogram on the fly from DF (fast for small data, potentially slow for big)
-            # Better to use a worker, but for visual snapiness on main thread with 'flights-1m.json' might be heavy.
-            # But wait, we need 'analyzer.df'.
-            analyzer = self.app.analyzer
-            if analyzer and analyzer.df is not None:
-                # Use numpy/polars to get histogram
-                try:
-                    import numpy as np
-                    col_data = analyzer.df[row_key].drop_nulls()
-                    if len(col_data) > 0:
-                        hist, bin_edges = np.histogram(col_data.to_numpy(), bins=20)
-                        chart = MiniChart.render_histogram(hist, bin_edges, width=60)
-                        detail_chart.update(chart)
-                    else:
-                        detail_chart.update("No data for histogram")
-                except Exception as e:
-                    detail_chart.update(f"Could not compute histogram: {e}")
-                    
+            histograms = getattr(self, "_histograms", {})
+            if row_key in histograms:
+                self._show_histogram(row_key, histograms[row_key])
+            else:
+                # Built on first selection, off the UI thread, and kept for later visits
+                detail_chart.update("Computing histogram...")
+                self._histogram_worker(row_key)
+
         elif isinstance(col_stats, CategoricalStats):
             # Show top values
             if col_stats.top_values:
-                # Render bar chart
-                lines = []
-                # top_values is list of (val, count, pct)
-                max_count = max(item[1] for item in col_stats.top_values) if col_stats.top_values else 1
-                for val, count, _ in col_stats.top_values:
-                    bar = MiniChart.render_bar(count, max_count, width=40, color="blue")
-                    lines.append(f"{str(val)[:20]:<20} {bar} {count}")
-                detail_chart.update(Text("\n".join(lines)))
+                # Render bar chart; top_values is list of (val, count, pct)
+                max_count = max(item[1] for item in col_stats.top_values)
+                chart = Text()
+                for i, (val, count, _) in enumerate(col_stats.top_values):
+                    if i:
+                        chart.append("\n")
+                    chart.append(f"{str(val)[:20]:<20} ")
+                    chart.append(MiniChart.render_bar(count, max_count, width=40, color="blue"))
+                    chart.append(f" {count}")
+                detail_chart.update(chart)
             else:
                 detail_chart.update("No top values available")
         else:
             detail_chart.update("No visual distribution available for this type")
 
+    @work(thread=True, group="histogram")
+    def _histogram_worker(self, col_name: str) -> None:
+        histogram = None
+        analyzer = self.app.analyzer
+        if analyzer is not None:
+            col_data = analyzer.df[col_name].drop_nulls()
+            if len(col_data) > 0:
+                try:
+                    histogram = np.histogram(col_data.to_numpy(), bins=20)
+                except Exception:
+                    histogram = None
+        self.app.call_from_thread(self._store_histogram, col_name, histogram)
+
+    def _store_histogram(self, col_name, histogram) -> None:
+        self._histograms[col_name] = histogram
+        if getattr(self, "_selected_column", None) == col_name:
+            self._show_histogram(col_name, histogram)
+
+    def _show_histogram(self, col_name, histogram) -> None:
+        detail_chart = self.query_one("#stats-detail-chart", Static)
+        if histogram is None:
+            detail_chart.update("No data for histogram")
+            return
+        hist, bin_edges = histogram
+        detail_chart.update(MiniChart.render_histogram(hist, bin_edges, width=60))
+
     def _render_error(self, message):
+        self._in_flight = False
         loading = self.query_one("#statistics-loading", LoadingIndicator)
-        content = self.query_one("#statistics-content")
         loading.display = False
-        content.display = True
         detail = self.query_one("#stats-detail-text", Static)
         detail.update(f"[red]Error: {message}[/]")
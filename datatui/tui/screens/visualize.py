@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 import polars as pl
 
+from datatui.core.correlations import pairwise_pearson_matrix
 from datatui.visualizers.terminal import (
     preview_histogram, preview_box_plot, preview_scatter, preview_correlation_heatmap
 )
@@ -140,26 +141,20 @@ class VisualizeScreen(Screen):
         yield LoadingIndicator(id="visualize-loading")
 
     def on_mount(self) -> None:
+        self._groups = {
+            k: self.query_one(f"#group-{k}") for k in ("numeric", "multi", "scatter", "cat")
+        }
+        self._current_plot_type = "histogram"
+        self._multi_checkboxes: List[Checkbox] = []
         self.load_data()
 
     def load_data(self) -> None:
-        loading = self.query_one("#visualize-loading", LoadingIndicator)
-        content = self.query_one("#visualize-content")
-        loading.display = True
-        content.display = False
-        self._load_data_worker()
-
-    @work(exclusive=True, thread=True)
-    def _load_data_worker(self) -> None:
         analyzer = self.app.analyzer
         if analyzer is None:
-             return
-             
-        numeric_cols = [c for c, t in zip(analyzer.df.columns, analyzer.df.dtypes) if t in pl.NUMERIC_DTYPES]
-        cat_cols = [c for c, t in zip(analyzer.df.columns, analyzer.df.dtypes) if t in [pl.String, pl.Categorical, pl.Boolean]]
-        all_cols = analyzer.df.columns
-        
-        self.app.call_from_thread(self._setup_ui, numeric_cols, cat_cols, all_cols)
+            return
+
+        # Schema-only and cached on the analyzer, so no worker is needed
+        self._setup_ui(*analyzer.get_column_groups())
 
     def _setup_ui(self, numeric_cols, cat_cols, all_cols):
         self._numeric_cols = numeric_cols
@@ -185,19 +180,14 @@ class VisualizeScreen(Screen):
         # Populate Multi-col list
         multi_list = self.query_one("#multi-col-list", ScrollableContainer)
         multi_list.remove_children()
-        for col in numeric_cols:
-            multi_list.mount(Checkbox(col, id=f"cb-{col}"))
+        self._multi_checkboxes = [Checkbox(col, id=f"cb-{col}") for col in numeric_cols]
+        multi_list.mount(*self._multi_checkboxes)
             
         self._update_selectors("histogram")
 
     def _update_selectors(self, plot_type: str):
-        groups = {
-            "numeric": self.query_one("#group-numeric"),
-            "multi": self.query_one("#group-multi"),
-            "scatter": self.query_one("#group-scatter"),
-            "cat": self.query_one("#group-cat")
-        }
-        
+        groups = self._groups
+
         for g in groups.values(): 
             g.display = False
         
@@ -212,12 +202,12 @@ class VisualizeScreen(Screen):
             groups["cat"].display = True
             
     def _get_current_plot_type(self) -> str:
-        active = self.query_one("#plot-type-selector").pressed_button
-        return str(active.label).lower()
+        return self._current_plot_type
 
     @on(RadioSet.Changed, "#plot-type-selector")
     def on_plot_type_changed(self, event: RadioSet.Changed):
         label = str(event.pressed.label).lower()
+        self._current_plot_type = label
         self._update_selectors(label)
         dataset_name = self.app.analyzer.dataset_name if self.app.analyzer else "plot"
         self.query_one("#input-filename").value = f"{label.replace(' ', '_')}_{dataset_name}.png"
@@ -252,23 +242,32 @@ class VisualizeScreen(Screen):
                 x_col = self.query_one("#select-scatter-x", Select).value
                 y_col = self.query_one("#select-scatter-y", Select).value
                 if x_col == Select.BLANK or y_col == Select.BLANK: raise ValueError("Select X and Y")
-                x_data = df[x_col].drop_nulls().to_list()
-                y_data = df[y_col].drop_nulls().to_list()
-                if len(x_data) > 1000:
-                    x_data = x_data[:1000]
-                    y_data = y_data[:1000]
-                preview_str = preview_scatter(x_data, y_data, x_col, y_col)
+                points = (
+                    df.lazy()
+                    .select(pl.col(x_col).alias("x"), pl.col(y_col).alias("y"))
+                    .drop_nulls()
+                    .limit(1000)
+                    .collect()
+                )
+                preview_str = preview_scatter(points["x"].to_list(), points["y"].to_list(), x_col, y_col)
             
             elif "box" in label:
-                selected = [cb.label.plain for cb in self.query_one("#multi-col-list").query(Checkbox) if cb.value]
+                selected = [cb.label.plain for cb in self._multi_checkboxes if cb.value]
                 if not selected: raise ValueError("Check at least one column")
-                data_dict = {col: df[col].drop_nulls().to_list()[:500] for col in selected[:5]}
+                cols = selected[:5]
+                row = (
+                    df.lazy()
+                    .select([pl.col(c).drop_nulls().head(500).implode() for c in cols])
+                    .collect()
+                    .row(0)
+                )
+                data_dict = dict(zip(cols, row))
                 preview_str = preview_box_plot(data_dict)
                 
             elif "correlation" in label:
                 numeric_df = df.select(pl.col(pl.NUMERIC_DTYPES))
                 if numeric_df.width < 2: raise ValueError("Need 2+ numeric columns")
-                corr_matrix = numeric_df.to_pandas().corr().values.tolist()
+                corr_matrix = pairwise_pearson_matrix(numeric_df)
                 preview_str = preview_correlation_heatmap(corr_matrix, numeric_df.columns)
 
             elif "categorical" in label:
@@ -325,12 +324,12 @@ class VisualizeScreen(Screen):
                 generate_histogram(df, col, output_path, format=fmt, dpi=dpi)
             
             elif ptype == "box plot":
-                cols = [cb.label.plain for cb in self.query_one("#multi-col-list").query(Checkbox) if cb.value]
+                cols = [cb.label.plain for cb in self._multi_checkboxes if cb.value]
                 generate_box_plot(df, cols, output_path, format=fmt, dpi=dpi)
             
             elif ptype == "correlation heatmap":
                 numeric_df = df.select(pl.col(pl.NUMERIC_DTYPES))
-                corr_matrix = numeric_df.to_pandas().corr().values.tolist()
+                corr_matrix = pairwise_pearson_matrix(numeric_df)
                 generate_correlation_heatmap(corr_matrix, numeric_df.columns, output_path, format=fmt, dpi=dpi)
             
             elif ptype == "scatter plot":
@@ -341,11 +340,11 @@ class VisualizeScreen(Screen):
                 generate_scatter_plot(df, x_col, y_col, output_path, hue_col=hue_col, format=fmt, dpi=dpi)
             
             elif ptype == "pair plot":
-                cols = [cb.label.plain for cb in self.query_one("#multi-col-list").query(Checkbox) if cb.value]
+                cols = [cb.label.plain for cb in self._multi_checkboxes if cb.value]
                 generate_pair_plot(df, cols, output_path, format=fmt, dpi=dpi)
             
             elif ptype == "violin plot":
-                cols = [cb.label.plain for cb in self.query_one("#multi-col-list").query(Checkbox) if cb.value]
+                cols = [cb.label.plain for cb in self._multi_checkboxes if cb.value]
                 generate_violin_plot(df, cols, output_path, format=fmt, dpi=dpi)
             
             elif ptype == "distribution comparison":
@@ -374,7 +373,10 @@ class VisualizeScreen(Screen):
     def _batch_worker(self, output_dir: Path):
         from datatui.cli.commands.visualize import run_batch_mode
         try:
-            run_batch_mode(self.app.analyzer.df, output_dir, "png", 150)
+            df = self.app.analyzer.df
+            numeric_df = df.select(pl.col(pl.NUMERIC_DTYPES))
+            corr_matrix = pairwise_pearson_matrix(numeric_df) if numeric_df.width >= 2 else None
+            run_batch_mode(df, output_dir, "png", 150, numeric_df=numeric_df, corr_matrix=corr_matrix)
             self.app.call_from_thread(self._log, f"Batch complete: {output_dir.absolute()}", "bold green")
         except Exception as e:
             self.app.call_from_thread(self._log, f"Batch Error: {e}", "red")
@@ -5,9 +5,12 @@ from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widgets import DataTable as TextualDataTable, Input, Static
 from textual.reactive import reactive
+from textual.timer import Timer
 
 __all__ = ["FilterableDataTable"]
 
+FILTER_DEBOUNCE_SECONDS = 0.12
+
 
 class FilterableDataTable(Widget):
 
@@ -33,6 +36,10 @@ class FilterableDataTable(Widget):
         self._columns = columns or []
         self._rows: List[List[str]] = []
         self._all_rows: List[List[str]] = []
+        self._all_rows_lower: List[str] = []
+        self._last_filter = ""
+        self._last_filtered: List[int] = []
+        self._filter_timer: Optional[Timer] = None
 
     def compose(self) -> ComposeResult:
         yield Input(placeholder="Filter rows...", id="filter-input")
@@ -47,33 +54,51 @@ class FilterableDataTable(Widget):
         self._columns = columns
         self._all_rows = rows
         self._rows = rows
+        # One lowercased search key per row; \x1f keeps cells from running together
+        self._all_rows_lower = ["\x1f".join(str(cell).lower() for cell in row) for row in rows]
+        self._last_filter = ""
+        self._last_filtered = list(range(len(rows)))
 
         table = self.query_one("#inner-table", TextualDataTable)
-        table.clear(columns=True)
-        for col in columns:
-            table.add_column(col, key=col)
-        for row in rows:
-            table.add_row(*row)
+        with self.app.batch_update():
+            table.clear(columns=True)
+            for col in columns:
+                table.add_column(col, key=col)
+            table.add_rows(rows)
 
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "filter-input":
             self.filter_text = event.value
 
     def watch_filter_text(self, value: str) -> None:
-        self._apply_filter(value)
+        # Only the last keystroke of a burst pays for the table rebuild
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(
+            FILTER_DEBOUNCE_SECONDS, lambda: self._apply_filter(value)
+        )
 
     def _apply_filter(self, text: str) -> None:
         table = self.query_one("#inner-table", TextualDataTable)
-        table.clear()
 
         if not text:
+            self._last_filter = ""
+            self._last_filtered = list(range(len(self._all_rows)))
             filtered = self._all_rows
         else:
             lower_text = text.lower()
-            filtered = [
-                row for row in self._all_rows
-                if any(lower_text in str(cell).lower() for cell in row)
-            ]
-
-        for row in filtered:
-            table.add_row(*row)
+            # Appending characters can only narrow the match set, so rescan
+            # just the previous hits instead of every row
+            if self._last_filter and lower_text.startswith(self._last_filter):
+                candidates = self._last_filtered
+            else:
+                candidates = range(len(self._all_rows_lower))
+            keys = self._all_rows_lower
+            indices = [i for i in candidates if lower_text in keys[i]]
+            self._last_filter = lower_text
+            self._last_filtered = indices
+            filtered = [self._all_rows[i] for i in indices]
+
+        with self.app.batch_update():
+            table.clear()
+            table.add_rows(filtered)
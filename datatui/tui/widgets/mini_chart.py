@@ -1,6 +1,8 @@
 from typing import List, Optional, Union
 import math
 
+import numpy as np
+
 from textual.widget import Widget
 from textual.reactive import reactive
 from textual.app import ComposeResult
@@ -14,6 +16,24 @@ __all__ = ["MiniChart"]
 BLOCKS = [" ", "\u2581", "\u2582", "\u2583", "\u2584", "\u2585", "\u2586", "\u2587", "\u2588"]
 SPARK_BLOCKS = [" ", "\u2581", "\u2582", "\u2583", "\u2584", "\u2585", "\u2586", "\u2587", "\u2588"]
 
+# Glyph lookup tables indexed directly by integer level (0-8)
+_BLOCK_ARR = np.array(BLOCKS, dtype="<U1")
+_SPARK_ARR = np.array(SPARK_BLOCKS, dtype="<U1")
+
+_HEATMAP_BINS = np.array([-0.7, -0.3, 0.3, 0.7], dtype=np.float32)
+# Parsed once so heatmap cells carry ready Style objects instead of colour strings
+_HEATMAP_STYLES = tuple(
+    Style.parse(spec) for spec in ("bright_red", "red", "dim white", "green", "bright_green")
+)
+
+
+def _chunk_bounds(length: int, width: int):
+    """Start offsets and sizes of ``width`` consecutive chunks over ``length`` items."""
+    starts = (np.arange(width, dtype=np.intp) * length) // width
+    counts = np.diff(np.append(starts, length))
+    return starts, counts
+
+
 class MiniChart(Widget):
 
     DEFAULT_CSS = """
@@ -72,29 +92,24 @@ class MiniChart(Widget):
         if values is None or len(values) == 0:
             return "No data"
 
-        max_val = max(values) if len(values) > 0 else 1
-        min_val = min(values) if len(values) > 0 else 0
+        arr = np.asarray(values, dtype=np.float64)
+        max_val = float(arr.max())
+        min_val = float(arr.min())
 
-        if max_val == min_val:
-            normalized = [4 for _ in values]
+        span = max_val - min_val
+        if span == 0:
+            normalized = np.full(arr.shape, 4, dtype=np.int64)
         else:
-            normalized = [
-                int(((v - min_val) / (max_val - min_val)) * (len(BLOCKS) - 1))
-                for v in values
-            ]
-
-        display_width = min(self._width, len(values))
-        if len(values) > display_width:
-            chunk_size = len(values) / display_width
-            resampled = []
-            for i in range(display_width):
-                start = int(i * chunk_size)
-                end = int((i + 1) * chunk_size)
-                chunk = normalized[start:end]
-                resampled.append(int(sum(chunk) / len(chunk)) if chunk else 0)
-            normalized = resampled
-
-        bar_line = "".join(BLOCKS[min(max(0, n), len(BLOCKS) - 1)] for n in normalized)
+            normalized = ((arr - min_val) * ((len(BLOCKS) - 1) / span)).astype(np.int64)
+
+        display_width = min(self._width, len(arr))
+        if len(arr) > display_width:
+            # Average each chunk of consecutive values in a single reduceat pass
+            starts, counts = _chunk_bounds(len(arr), display_width)
+            normalized = np.add.reduceat(normalized, starts) // counts
+
+        np.clip(normalized, 0, len(BLOCKS) - 1, out=normalized)
+        bar_line = "".join(_BLOCK_ARR.take(normalized).tolist())
 
         lines = [
             f"  min: {min_val:.2f}  max: {max_val:.2f}  count: {len(values)}",
@@ -106,28 +121,24 @@ class MiniChart(Widget):
     @staticmethod
     def render_histogram(counts: List[int], edges: List[float], width: int = 50) -> Text:
         """Render a unicode histogram."""
-        # Handle numpy arrays safely
-        if hasattr(counts, "__len__") and len(counts) == 0:
+        counts_a = np.asarray(counts)
+        if counts_a.size == 0:
             return Text("")
-        if not hasattr(counts, "__len__") and not counts:
-             return Text("")
-             
-        try:
-            max_count = max(counts)
-        except ValueError:
-            max_count = 1
-            
-        if max_count == 0: max_count = 1
-        
-        lines = []
-        for i, count in enumerate(counts):
-            bar_len = int((count / max_count) * width)
-            bar = "\u2588" * bar_len
-            if i < len(edges) - 1:
-                label = f"{edges[i]:.1f}-{edges[i+1]:.1f}"
-            else:
-                label = ""
-            lines.append(f"{label:>15} {bar} {count}")
+        edges_l = np.asarray(edges, dtype=np.float64).tolist()
+
+        max_count = max(counts_a.max(), 1)
+        bar_lens = counts_a.astype(np.int64) * width // max_count
+        # Every bar is a prefix of one full-width bar
+        full_bar = "\u2588" * width
+
+        labels = [
+            f"{edges_l[i]:.1f}-{edges_l[i + 1]:.1f}" if i < len(edges_l) - 1 else ""
+            for i in range(len(counts_a))
+        ]
+        lines = [
+            f"{label:>15} {full_bar[:bar_len]} {count}"
+            for label, bar_len, count in zip(labels, bar_lens.tolist(), counts_a.tolist())
+        ]
             
         return Text("\n".join(lines), style="#58a6ff")
 
@@ -149,34 +160,25 @@ class MiniChart(Widget):
     @staticmethod
     def render_sparkline(values: List[float], width: int = 20) -> str:
         """Render a sparkline using unicode blocks."""
-        if not values:
+        if values is None or len(values) == 0:
             return ""
             
+        arr = np.asarray(values, dtype=np.float64)
+
         # Resample if needed
-        if len(values) > width:
-            chunk_size = len(values) / width
-            resampled = []
-            for i in range(width):
-                 start = int(i * chunk_size)
-                 end = int((i + 1) * chunk_size)
-                 chunk = values[start:end]
-                 resampled.append(sum(chunk) / len(chunk) if chunk else 0)
-            values = resampled
-
-        min_val = min(values)
-        max_val = max(values)
+        if len(arr) > width:
+            starts, counts = _chunk_bounds(len(arr), width)
+            arr = np.add.reduceat(arr, starts) / counts
+
+        min_val = arr.min()
+        max_val = arr.max()
         range_val = max_val - min_val
         
         if range_val == 0:
-            return "\u2584" * len(values)
-            
-        chars = []
-        for v in values:
-            norm = (v - min_val) / range_val
-            idx = int(norm * (len(SPARK_BLOCKS) - 1))
-            chars.append(SPARK_BLOCKS[idx])
+            return "\u2584" * len(arr)
             
-        return "".join(chars)
+        idx = ((arr - min_val) * ((len(SPARK_BLOCKS) - 1) / range_val)).astype(np.intp)
+        return "".join(_SPARK_ARR.take(idx).tolist())
 
     @staticmethod
     def render_heatmap(matrix: List[List[float]], labels: List[str] = None) -> Table:
@@ -192,34 +194,14 @@ class MiniChart(Widget):
             for i in range(len(matrix[0])):
                 table.add_column(str(i), justify="center", width=3)
                 
-        for i, row in enumerate(matrix):
+        # Classify every cell at once: -1 (bright red) -> 0 (dim) -> 1 (bright green)
+        arr = np.asarray(matrix, dtype=np.float32)
+        classes = np.digitize(arr, _HEATMAP_BINS, right=True)
+        classes[np.isnan(arr)] = 2
+
+        for i, row_classes in enumerate(classes.tolist()):
             cells = [labels[i][:10] if labels else str(i)]
-            for val in row:
-                # Color mapping: -1 (red) -> 0 (white) -> 1 (green)
-                # We use background colors
-                if val is None:
-                    color = "#30363d" # gray
-                    symbol = " "
-                elif val >= 0:
-                    intensity = int(val * 255)
-                    # Green scale
-                    color = f"rgb(0,{intensity},0)" if intensity > 50 else "#0d1117"
-                    symbol = "\u2588"
-                else:
-                    intensity = int(abs(val) * 255)
-                    # Red scale
-                    color = f"rgb({intensity},0,0)" if intensity > 50 else "#0d1117"
-                    symbol = "\u2588"
-                
-                # Using rich styling for block
-                # Simplified: use text color for block
-                if val > 0.7: style = "bright_green"
-                elif val > 0.3: style = "green"
-                elif val > -0.3: style = "dim white"
-                elif val > -0.7: style = "red"
-                else: style = "bright_red"
-                
-                cells.append(Text("\u2588\u2588", style=style))
+            cells.extend(Text("\u2588\u2588", style=_HEATMAP_STYLES[c]) for c in row_classes)
             table.add_row(*cells)
             
         return table
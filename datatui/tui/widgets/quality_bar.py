@@ -13,6 +13,12 @@ QUALITY_COLORS = {
     "poor": "error",
 }
 
+# Indexed by score // 15 so the buckets fall on the 60 and 75 cutoffs
+_SCORE_CLASS = ("error", "error", "error", "error", "warning", "success", "success")
+
+# Score changes within one frame are coalesced into a single redraw
+UPDATE_DEBOUNCE_SECONDS = 0.016
+
 
 class QualityBar(Widget):
 
@@ -36,6 +42,7 @@ class QualityBar(Widget):
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
+        self._pending_update = False
         self.score = score
         self.rating = rating
         self._label = label
@@ -48,6 +55,13 @@ class QualityBar(Widget):
         self._update_bar()
 
     def watch_score(self, new_score: float) -> None:
+        if self._pending_update or not self.is_mounted:
+            return
+        self._pending_update = True
+        self.set_timer(UPDATE_DEBOUNCE_SECONDS, self._flush_update)
+
+    def _flush_update(self) -> None:
+        self._pending_update = False
         self._update_bar()
 
     def _update_bar(self) -> None:
@@ -56,13 +70,9 @@ class QualityBar(Widget):
             bar.update(progress=self.score)
             
             # Update color based on score
+            cls = _SCORE_CLASS[min(max(int(self.score // 15), 0), 6)]
             bar.ctx.classes.difference_update({"success", "warning", "error"})
-            if self.score >= 75:
-                bar.add_class("success")
-            elif self.score >= 60:
-                bar.add_class("warning")
-            else:
-                bar.add_class("error")
+            bar.add_class(cls)
                 
             label = self.query_one("#quality-label", Static)
             label.update(f"{self._label}: {self.score:.1f}/100 ({self.rating.upper()})")
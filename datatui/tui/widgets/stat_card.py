@@ -6,6 +6,11 @@ from textual.widgets import Static
 
 __all__ = ["StatCard"]
 
+_TREND_ICONS = {"up": " \u2191", "down": " \u2193"}
+
+# Reactive changes within one frame are coalesced into a single redraw
+UPDATE_DEBOUNCE_SECONDS = 0.016
+
 
 class StatCard(Widget):
 
@@ -40,6 +45,8 @@ class StatCard(Widget):
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
+        self._last_text = ""
+        self._pending_update = False
         self.label = label
         self.value = value
         self.variant = variant
@@ -47,30 +54,46 @@ class StatCard(Widget):
         self.trend = trend
 
     def compose(self) -> ComposeResult:
-        trend_icon = " \u2191" if self.trend == "up" else " \u2193" if self.trend == "down" else ""
-        yield Static(f"{self.label}: {self.value}{trend_icon}", classes="card-content")
+        self._last_text = f"{self.label}: {self.value}{_TREND_ICONS.get(self.trend, '')}"
+        yield Static(self._last_text, classes="card-content")
 
     def on_mount(self) -> None:
+        # Picks up any change made between compose and mount
+        self._update_display()
         if self.color:
              self.styles.border = ("solid", self.color)
              # self.query_one(".card-content").styles.color = self.color # Optional text color
 
     def watch_value(self, new_value: str) -> None:
-        self._update_display()
+        self._schedule_update()
             
     def watch_trend(self, new_trend: str) -> None:
+        self._schedule_update()
+
+    def _schedule_update(self) -> None:
+        if self._pending_update or not self.is_mounted:
+            return
+        self._pending_update = True
+        self.set_timer(UPDATE_DEBOUNCE_SECONDS, self._flush_update)
+
+    def _flush_update(self) -> None:
+        self._pending_update = False
         self._update_display()
         
     def _update_display(self) -> None:
         try:
-            trend_icon = " \u2191" if self.trend == "up" else " \u2193" if self.trend == "down" else ""
+            new_text = f"{self.label}: {self.value}{_TREND_ICONS.get(self.trend, '')}"
+            # Skip the re-render when a watcher fires without changing the text
+            if new_text == self._last_text:
+                return
             content = self.query_one(".card-content", Static)
-            content.update(f"{self.label}: {self.value}{trend_icon}")
+            content.update(new_text)
+            self._last_text = new_text
         except Exception:
             pass
 
     def watch_label(self, new_label: str) -> None:
-        self._update_display()
+        self._schedule_update()
 
     def watch_variant(self, new_variant: str) -> None:
         self.remove_class("success", "warning", "error", "info")
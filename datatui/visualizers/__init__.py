@@ -1,4 +1,4 @@
-from .themes import apply_theme
+from .themes import apply_theme, reset_theme
 from .terminal import (
     preview_histogram,
     preview_box_plot,
@@ -20,6 +20,7 @@ from .plots import (
 
 __all__ = [
     "apply_theme",
+    "reset_theme",
     "preview_histogram",
     "preview_box_plot",
     "preview_scatter",
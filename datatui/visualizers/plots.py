@@ -9,10 +9,44 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 from .themes import apply_theme
 
-def _to_pandas(df: Union[pl.DataFrame, pd.DataFrame]) -> pd.DataFrame:
-    """Convert polars to pandas for seaborn compatibility."""
+try:
+    from fast_histogram import histogram1d
+except ImportError:
+    histogram1d = None
+
+HIST_BINS = 50
+KDE_MAX_ROWS = 10_000
+KDE_SAMPLE_ROWS = 5_000
+SCATTER_HEXBIN_ROWS = 20_000
+QQ_MAX_POINTS = 5_000
+
+# zlib level 6 dominates 300 DPI PNG encoding; level 1 is several times faster
+_SAVE_KWARGS = {"pil_kwargs": {"compress_level": 1}, "metadata": {"Software": "datatui"}}
+
+def _to_pandas(df: Union[pl.DataFrame, pd.DataFrame], cols: Optional[List[str]] = None,
+               max_rows: Optional[int] = None) -> pd.DataFrame:
+    """Convert polars to pandas for seaborn compatibility.
+
+    Only ``cols`` are converted, and frames longer than ``max_rows`` are
+    sampled in Polars first so the pandas copy stays small. Float64 columns
+    are downcast to float32: about 7 significant digits, which is plenty
+    for plotting but not for reusing the result in further computation.
+    """
+    if cols:
+        cols = list(dict.fromkeys(cols))
     if isinstance(df, pl.DataFrame):
-        return df.to_pandas()
+        if cols:
+            df = df.select(cols)
+        if max_rows is not None and df.height > max_rows:
+            df = df.sample(n=max_rows, seed=42)
+        return df.with_columns(pl.col(pl.Float64).cast(pl.Float32)).to_pandas()
+    if cols:
+        df = df[cols]
+    if max_rows is not None:
+        df = _sample_df(df, max_rows)
+    num_cols = df.select_dtypes(include=['float64']).columns
+    if len(num_cols):
+        df = df.astype({c: np.float32 for c in num_cols})
     return df
 
 def _sample_df(df: pd.DataFrame, max_rows: int = 100000) -> pd.DataFrame:
@@ -25,11 +59,41 @@ def generate_histogram(df: pl.DataFrame, column: str, output_path: Path,
                        format: str = 'png', dpi: int = 300) -> Path:
     """Generate a high-quality histogram with KDE."""
     apply_theme()
-    pdf = _to_pandas(df)
-    pdf = _sample_df(pdf)
+    pdf = _to_pandas(df, [column], max_rows=100000)
     
-    plt.figure(figsize=(10, 6))
-    sns.histplot(data=pdf, x=column, kde=True, color='#58a6ff')
+    fig = plt.figure(figsize=(10, 6))
+    values = pdf[column].dropna().to_numpy(dtype=np.float64)
+    if values.size == 0:
+        raise ValueError(f"Column '{column}' has no data")
+
+    lo, hi = float(values.min()), float(values.max())
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    if histogram1d is not None:
+        # fast-histogram's upper bound is exclusive; nudge it so the max lands in the last bin
+        counts = histogram1d(values, bins=HIST_BINS, range=(lo, np.nextafter(hi, np.inf)))
+    else:
+        counts, _ = np.histogram(values, bins=HIST_BINS, range=(lo, hi))
+    edges = np.linspace(lo, hi, HIST_BINS + 1)
+    bin_width = edges[1] - edges[0]
+
+    ax = plt.gca()
+    ax.bar(edges[:-1], counts, width=bin_width, align='edge', color='#58a6ff')
+    ax.set_xlabel(column)
+    ax.set_ylabel('Count')
+
+    # KDE cost grows with every point; large columns fit it on a subsample.
+    # The curve is scaled to counts the same way seaborn's histplot does.
+    try:
+        from scipy import stats
+        kde_data = values
+        if values.size > KDE_MAX_ROWS:
+            kde_data = np.random.default_rng(42).choice(values, KDE_SAMPLE_ROWS, replace=False)
+        grid = np.linspace(lo, hi, 200)
+        density = stats.gaussian_kde(kde_data)(grid) * values.size * bin_width
+        ax.plot(grid, density, color='#58a6ff')
+    except Exception:
+        pass
     
     # Add mean/median lines
     mean_val = pdf[column].mean()
@@ -40,18 +104,17 @@ def generate_histogram(df: pl.DataFrame, column: str, output_path: Path,
     plt.title(f"Distribution of {column}")
     plt.legend()
     plt.tight_layout()
-    plt.savefig(output_path, format=format, dpi=dpi)
-    plt.close()
+    fig.savefig(output_path, format=format, dpi=dpi, **(_SAVE_KWARGS if format == "png" else {}))
+    plt.close(fig)
     return output_path
 
 def generate_box_plot(df: pl.DataFrame, columns: List[str], output_path: Path,
                       format: str = 'png', dpi: int = 300) -> Path:
     """Generate side-by-side box plots."""
     apply_theme()
-    pdf = _to_pandas(df)
-    pdf = _sample_df(pdf)
+    pdf = _to_pandas(df, columns, max_rows=100000)
     
-    plt.figure(figsize=(12, 6))
+    fig = plt.figure(figsize=(12, 6))
     # Melt for side-by-side comparison if multiple columns
     if len(columns) > 1:
         melted = pdf.melt(value_vars=columns)
@@ -64,27 +127,28 @@ def generate_box_plot(df: pl.DataFrame, columns: List[str], output_path: Path,
     
     plt.title("Box Plot Comparison")
     plt.tight_layout()
-    plt.savefig(output_path, format=format, dpi=dpi)
-    plt.close()
+    fig.savefig(output_path, format=format, dpi=dpi, **(_SAVE_KWARGS if format == "png" else {}))
+    plt.close(fig)
     return output_path
 
 def generate_correlation_heatmap(correlation_matrix: List[List[float]], 
                                  labels: List[str], output_path: Path,
                                  format: str = 'png', dpi: int = 300) -> Path:
     """Generate a Seaborn heatmap from a correlation matrix."""
+    arr = np.ascontiguousarray(np.asarray(correlation_matrix, dtype=np.float32))
     apply_theme()
     
-    plt.figure(figsize=(12, 10))
-    mask = np.triu(np.ones_like(correlation_matrix, dtype=bool))
+    fig = plt.figure(figsize=(12, 10))
+    mask = np.triu(np.ones(arr.shape, dtype=bool))
     
-    sns.heatmap(correlation_matrix, xticklabels=labels, yticklabels=labels,
-                annot=True, fmt=".2f", cmap='RdYlGn', center=0,
+    sns.heatmap(arr, xticklabels=labels, yticklabels=labels,
+                annot=True, fmt=".2f", annot_kws={"fontsize": 7}, cmap='RdYlGn', center=0,
                 square=True, linewidths=.5, cbar_kws={"shrink": .5}, mask=mask)
     
     plt.title("Correlation Matrix Heatmap")
     plt.tight_layout()
-    plt.savefig(output_path, format=format, dpi=dpi)
-    plt.close()
+    fig.savefig(output_path, format=format, dpi=dpi, **(_SAVE_KWARGS if format == "png" else {}))
+    plt.close(fig)
     return output_path
 
 def generate_scatter_plot(df: pl.DataFrame, x_col: str, y_col: str, 
@@ -92,14 +156,19 @@ def generate_scatter_plot(df: pl.DataFrame, x_col: str, y_col: str,
                          format: str = 'png', dpi: int = 300) -> Path:
     """Generate a scatter plot with optional hue and trend line."""
     apply_theme()
-    pdf = _to_pandas(df)
-    pdf = _sample_df(pdf)
+    pdf = _to_pandas(df, [x_col, y_col] + ([hue_col] if hue_col else []), max_rows=100000)
     
-    plt.figure(figsize=(10, 6))
+    fig = plt.figure(figsize=(10, 6))
     if hue_col:
-        sns.scatterplot(data=pdf, x=x_col, y=y_col, hue=hue_col)
+        sns.scatterplot(data=pdf, x=x_col, y=y_col, hue=hue_col, s=5, rasterized=True)
     else:
-        sns.scatterplot(data=pdf, x=x_col, y=y_col)
+        if len(pdf) > SCATTER_HEXBIN_ROWS:
+            # Too many points for individual markers; bin them into a density tile
+            valid = pdf[x_col].notna() & pdf[y_col].notna()
+            hb = plt.gca().hexbin(pdf[x_col][valid], pdf[y_col][valid], gridsize=80, cmap='viridis', mincnt=1)
+            plt.colorbar(hb)
+        else:
+            sns.scatterplot(data=pdf, x=x_col, y=y_col, s=5, rasterized=True)
         # Add regression line only for single color
         try:
             sns.regplot(data=pdf, x=x_col, y=y_col, scatter=False, color='#f85149')
@@ -113,8 +182,8 @@ def generate_scatter_plot(df: pl.DataFrame, x_col: str, y_col: str,
             
     plt.title(f"{x_col} vs {y_col}")
     plt.tight_layout()
-    plt.savefig(output_path, format=format, dpi=dpi)
-    plt.close()
+    fig.savefig(output_path, format=format, dpi=dpi, **(_SAVE_KWARGS if format == "png" else {}))
+    plt.close(fig)
     return output_path
 
 def generate_pair_plot(df: pl.DataFrame, columns: List[str], 
@@ -122,16 +191,14 @@ def generate_pair_plot(df: pl.DataFrame, columns: List[str],
                       format: str = 'png', dpi: int = 300) -> Path:
     """Generate a Seaborn pairplot."""
     apply_theme()
-    pdf = _to_pandas(df)
-    # Pairplots are very heavy, sample more aggressively
-    pdf = _sample_df(pdf, max_rows=5000)
-    
     cols_to_plot = columns + ([hue_col] if hue_col else [])
+    # Pairplots are very heavy, sample more aggressively
+    pdf = _to_pandas(df, cols_to_plot, max_rows=5000)
     
     g = sns.pairplot(data=pdf[cols_to_plot], hue=hue_col, corner=True)
     g.fig.suptitle("Pair Plot Analysis", y=1.02)
     
-    plt.savefig(output_path, format=format, dpi=dpi)
+    plt.savefig(output_path, format=format, dpi=dpi, **(_SAVE_KWARGS if format == "png" else {}))
     plt.close()
     return output_path
 
@@ -139,10 +206,9 @@ def generate_violin_plot(df: pl.DataFrame, columns: List[str],
                         output_path: Path, format: str = 'png', dpi: int = 300) -> Path:
     """Generate distribution shape visualization via violin plot."""
     apply_theme()
-    pdf = _to_pandas(df)
-    pdf = _sample_df(pdf)
+    pdf = _to_pandas(df, columns, max_rows=100000)
     
-    plt.figure(figsize=(12, 6))
+    fig = plt.figure(figsize=(12, 6))
     if len(columns) > 1:
         melted = pdf.melt(value_vars=columns)
         sns.violinplot(data=melted, x='variable', y='value', split=True, inner="quart")
@@ -152,40 +218,46 @@ def generate_violin_plot(df: pl.DataFrame, columns: List[str],
         
     plt.title("Violin Plot Distribution")
     plt.tight_layout()
-    plt.savefig(output_path, format=format, dpi=dpi)
-    plt.close()
+    fig.savefig(output_path, format=format, dpi=dpi, **(_SAVE_KWARGS if format == "png" else {}))
+    plt.close(fig)
     return output_path
 
 def generate_distribution_comparison(df: pl.DataFrame, column: str, 
                                    output_path: Path, format: str = 'png', dpi: int = 300) -> Path:
     """Generate a 4-panel distribution analysis plot."""
     apply_theme()
-    pdf = _to_pandas(df)
-    pdf = _sample_df(pdf)
+    pdf = _to_pandas(df, [column], max_rows=100000)
+    
+    # Sorted once (as a copy, so pdf is untouched) and shared by the panels below
+    data = np.sort(pdf[column].dropna().to_numpy())
     
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig = plt.figure(figsize=(14, 10))
+    axes = fig.subplots(2, 2)
     
     # 1. Histogram
     sns.histplot(pdf[column], kde=True, ax=axes[0, 0], color='#58a6ff')
     axes[0, 0].set_title('Histogram & KDE')
     
     # 2. Box Plot
-    sns.boxplot(y=pdf[column], ax=axes[0, 1], color='#3fb950')
+    sns.boxplot(y=data, ax=axes[0, 1], color='#3fb950')
+    axes[0, 1].set_ylabel(column)
     axes[0, 1].set_title('Box Plot')
     
     # 3. Violin Plot
-    sns.violinplot(y=pdf[column], ax=axes[1, 0], color='#bc8cff')
+    sns.violinplot(y=data, ax=axes[1, 0], color='#bc8cff')
+    axes[1, 0].set_ylabel(column)
     axes[1, 0].set_title('Violin Plot')
     
-    # 4. QQ Plot
+    # 4. QQ Plot: evenly strided quantiles of the sorted data are enough to draw it
     from scipy import stats
-    stats.probplot(pdf[column].dropna(), plot=axes[1, 1])
+    qq_data = data[::max(1, len(data) // QQ_MAX_POINTS)]
+    stats.probplot(qq_data, plot=axes[1, 1])
     axes[1, 1].set_title('QQ Plot')
     
     plt.suptitle(f"Comprehensive Distribution Analysis: {column}", fontsize=16)
     plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-    plt.savefig(output_path, format=format, dpi=dpi)
-    plt.close()
+    fig.savefig(output_path, format=format, dpi=dpi, **(_SAVE_KWARGS if format == "png" else {}))
+    plt.close(fig)
     return output_path
 
 def generate_categorical_bar(df: pl.DataFrame, column: str, 
@@ -193,23 +265,40 @@ def generate_categorical_bar(df: pl.DataFrame, column: str,
                            format: str = 'png', dpi: int = 300) -> Path:
     """Generate a bar chart of value counts."""
     apply_theme()
-    counts = df[column].value_counts().sort('counts', descending=True).head(top_n)
-    pdf = counts.to_pandas()
+    series = df[column]
+    # Percentages are of non-null values, as with series.count()
+    total = max(df.height - series.null_count(), 1)
+    if series.dtype.base_type() == pl.Enum:
+        # Enum physical codes index the fixed category list, so a bincount
+        # replaces the hash-based value_counts
+        codes = series.drop_nulls().to_physical().to_numpy()
+        labels = series.dtype.categories.to_numpy()
+        freq = np.bincount(codes, minlength=len(labels))
+        order = np.argsort(-freq, kind='stable')[:top_n]
+        order = order[freq[order] > 0]
+        categories = [str(v) for v in labels[order]]
+        count_vals = freq[order].tolist()
+    else:
+        counts = series.value_counts().sort('count', descending=True).head(top_n)
+        categories = [str(v) for v in counts[column].to_list()]
+        count_vals = counts['count'].to_list()
+    pcts = [c / total * 100 for c in count_vals]
     
-    plt.figure(figsize=(10, 8))
-    sns.barplot(data=pdf, y=column, x='counts', palette='viridis')
+    fig = plt.figure(figsize=(10, 8))
+    ax = plt.gca()
+    bars = ax.barh(categories, count_vals,
+                   color=sns.color_palette('viridis', len(categories)))
+    ax.invert_yaxis()
+    ax.set_xlabel('count')
+    ax.set_ylabel(column)
     
     # Add percentages
-    total = df[column].count()
-    for i, p in enumerate(plt.gca().patches):
-        width = p.get_width()
-        plt.gca().text(width + total*0.01, p.get_y() + p.get_height()/2,
-                f'{width/total*100:.1f}%', va='center')
+    ax.bar_label(bars, labels=[f'{p:.1f}%' for p in pcts], padding=3)
                 
     plt.title(f"Value Counts: {column} (Top {top_n})")
     plt.tight_layout()
-    plt.savefig(output_path, format=format, dpi=dpi)
-    plt.close()
+    fig.savefig(output_path, format=format, dpi=dpi, **(_SAVE_KWARGS if format == "png" else {}))
+    plt.close(fig)
     return output_path
 
 def generate_missing_pattern(df: pl.DataFrame, output_path: Path,
@@ -217,18 +306,20 @@ def generate_missing_pattern(df: pl.DataFrame, output_path: Path,
     """Generate a heatmap showing missing data patterns."""
     apply_theme()
     # Sample if too large
-    if len(df) > 500:
-        pdf_missing = df.sample(n=500).to_pandas().isna()
-    else:
-        pdf_missing = df.to_pandas().isna()
+    sampled = df.sample(n=500, seed=42) if df.height > 500 else df
+    # pandas isna() also flagged float NaN, so keep showing it as missing
+    mask = sampled.select([
+        pl.col(c).is_null() | pl.col(c).is_nan() if dtype.is_float() else pl.col(c).is_null()
+        for c, dtype in sampled.schema.items()
+    ]).to_numpy()
         
-    plt.figure(figsize=(12, 8))
-    sns.heatmap(pdf_missing, cbar=False, yticklabels=False, cmap='binary_r')
+    fig = plt.figure(figsize=(12, 8))
+    sns.heatmap(mask, cbar=False, yticklabels=False, xticklabels=sampled.columns, cmap='binary_r')
     
     plt.title("Missing Data Pattern (White=Present, Black=Missing)")
     plt.tight_layout()
-    plt.savefig(output_path, format=format, dpi=dpi)
-    plt.close()
+    fig.savefig(output_path, format=format, dpi=dpi, **(_SAVE_KWARGS if format == "png" else {}))
+    plt.close(fig)
     return output_path
 
 def generate_time_series(df: pl.DataFrame, date_col: str, value_col: str,
@@ -239,7 +330,7 @@ def generate_time_series(df: pl.DataFrame, date_col: str, value_col: str,
     pdf[date_col] = pd.to_datetime(pdf[date_col])
     pdf = pdf.sort_values(date_col)
     
-    plt.figure(figsize=(12, 6))
+    fig = plt.figure(figsize=(12, 6))
     plt.plot(pdf[date_col], pdf[value_col], alpha=0.3, label='Actual', color='#58a6ff')
     
     # Rolling average
@@ -249,6 +340,6 @@ def generate_time_series(df: pl.DataFrame, date_col: str, value_col: str,
     plt.title(f"Time Series: {value_col} over {date_col}")
     plt.legend()
     plt.tight_layout()
-    plt.savefig(output_path, format=format, dpi=dpi)
-    plt.close()
+    fig.savefig(output_path, format=format, dpi=dpi, **(_SAVE_KWARGS if format == "png" else {}))
+    plt.close(fig)
     return output_path
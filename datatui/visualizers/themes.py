@@ -15,8 +15,15 @@ SEABORN_DARK_THEME = {
     'figure.dpi': 100
 }
 
+_APPLIED = False
+
 def apply_theme() -> None:
     """Apply the DataTUI dark theme to matplotlib and seaborn."""
+    global _APPLIED
+    if _APPLIED:
+        return
+    _APPLIED = True
+
     plt.style.use('dark_background')
     sns.set_theme(
         style="darkgrid",
@@ -32,3 +39,8 @@ def apply_theme() -> None:
         }
     )
     sns.set_palette(SEABORN_DARK_THEME['palette'])
+
+def reset_theme() -> None:
+    """Force the next apply_theme() call to re-apply the theme."""
+    global _APPLIED
+    _APPLIED = False
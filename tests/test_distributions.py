@@ -0,0 +1,20 @@
+import numpy as np
+import polars as pl
+
+from datatui.core.distributions import DistributionAnalyzer
+
+
+def _analyzer() -> DistributionAnalyzer:
+    return DistributionAnalyzer(pl.DataFrame({"x": [0.0]}))
+
+
+def test_normality_skips_shapiro_when_cheap_tests_agree():
+    data = np.random.default_rng(0).exponential(size=20_000)
+
+    results = _analyzer()._test_normality(data)
+
+    assert results["anderson_darling"] is not None
+    assert not results["dagostino_pearson"]["is_normal"]
+    assert not results["anderson_darling"]["is_normal"]
+    assert "shapiro_wilk" not in results
+    assert not results["is_normal"]
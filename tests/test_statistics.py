@@ -0,0 +1,33 @@
+import polars as pl
+
+from datatui.core.statistics import StatisticsAnalyzer, CategoricalStats, TextStats
+
+
+def test_tall_low_cardinality_column_is_categorical():
+    # 2,000 distinct values over 200k rows is 1%, but a 10k-row sample sees ~20%
+    df = pl.DataFrame({"code": [f"v{i % 2000}" for i in range(200_000)]})
+
+    stats = StatisticsAnalyzer(df).analyze_all()
+
+    assert isinstance(stats["code"], CategoricalStats)
+    assert stats["code"].unique_count == 2000
+
+
+def test_tall_low_cardinality_column_is_categorical_for_single_column():
+    df = pl.DataFrame({"code": [f"v{i % 2000}" for i in range(200_000)]})
+
+    assert isinstance(StatisticsAnalyzer(df).analyze_column("code"), CategoricalStats)
+
+
+def test_tall_high_cardinality_column_is_text():
+    df = pl.DataFrame({"id": [f"id-{i}" for i in range(200_000)]})
+
+    assert isinstance(StatisticsAnalyzer(df).analyze_all()["id"], TextStats)
+
+
+def test_sign_counts_treat_nan_as_positive():
+    df = pl.DataFrame({"x": [-2.0, 0.0, 1.5, float("nan"), None]})
+
+    stats = StatisticsAnalyzer(df).analyze_all()["x"]
+
+    assert (stats.negative_count, stats.zero_count, stats.positive_count) == (1, 1, 2)